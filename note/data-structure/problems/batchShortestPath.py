@@ -0,0 +1,199 @@
+"""
+共有メモリ上のグラフに対する多始点 BFS / ダイクストラのバッチ処理
+
+同じグラフに対して独立な単一始点クエリを大量に投げる場合、
+1 プロセスでは CPU 1 コアしか使えない。
+
+方針:
+1. グラフを CSR 形式の平坦な配列にして multiprocessing.shared_memory に 1 回だけ置く
+2. プロセスプールの各ワーカーは起動時に共有メモリを名前で開き、
+   memoryview をそのまま CSRGraph / CSRWeightedGraph として使う (コピーなし)
+3. 始点をワーカーに振り分け、各ワーカーは BFS / ダイクストラを実行して距離配列を返す
+4. 結果は終わったものから順に (始点, 距離配列) として受け取る
+
+隣接リストはワーカーごとに複製されないので、メモリ使用量はワーカー数に依存しない。
+スループットはおおよそコア数に比例する (結果の距離配列の転送は別途かかる)。
+"""
+
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, Optional, Union
+
+from problems.dijkstra import dijkstra
+from problems.graphSearch import bfs
+from structures.graph import (
+    CSRGraph,
+    CSRWeightedGraph,
+    Graph,
+    WeightedGraph,
+    read_graph_from_list,
+    read_weighted_graph_from_list,
+)
+
+# (共有メモリの名前, 型コード, 要素数)
+ArraySpec = tuple[str, str, int]
+
+
+class SharedCSR:
+    """
+    CSR 形式のグラフの配列を共有メモリに置くためのクラス
+
+    with 文で使い、抜けるときに共有メモリを解放する。
+
+    Attributes:
+        N: 頂点数
+        specs: 各配列 (offsets, targets[, weights]) の (名前, 型コード, 要素数)
+    """
+
+    def __init__(self, G: Union[CSRGraph, CSRWeightedGraph]) -> None:
+        """
+        グラフの配列を共有メモリにコピーする
+
+        Args:
+            G: CSR 形式のグラフ (重みなし・重み付きのどちらでもよい)
+        """
+        self.N = G.N
+        arrays = [G.offsets, G.targets]
+        if isinstance(G, CSRWeightedGraph):
+            arrays.append(G.weights)
+
+        self._blocks: list[SharedMemory] = []
+        self.specs: list[ArraySpec] = []
+        for a in arrays:
+            view = memoryview(a)
+            # サイズ 0 の共有メモリは作れないので最低 1 バイト確保する
+            shm = SharedMemory(create=True, size=max(view.nbytes, 1))
+            shm.buf[: view.nbytes] = view.cast("B")
+            self._blocks.append(shm)
+            self.specs.append((shm.name, view.format, len(view)))
+
+    def close(self) -> None:
+        """共有メモリを解放する"""
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedCSR":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ワーカープロセスごとのグラフ (_init_worker で設定する)
+_worker_blocks: list[SharedMemory] = []
+_worker_graph: Optional[Union[CSRGraph, CSRWeightedGraph]] = None
+
+
+def _attach(specs: list[ArraySpec]) -> list[memoryview]:
+    """共有メモリを名前で開き、型付きのビューを返す"""
+    views = []
+    for name, typecode, length in specs:
+        # プール内のワーカーは親プロセスと同じ resource_tracker を使うので、
+        # 開いた共有メモリは親の unlink でまとめて解放される
+        shm = SharedMemory(name=name)
+        _worker_blocks.append(shm)
+        views.append(shm.buf[: length * array(typecode).itemsize].cast(typecode))
+    return views
+
+
+def _init_worker(N: int, specs: list[ArraySpec]) -> None:
+    """ワーカープロセスの初期化: 共有メモリ上のグラフを開く"""
+    global _worker_graph
+    views = _attach(specs)
+    if len(views) == 3:
+        _worker_graph = CSRWeightedGraph(N, *views)
+    else:
+        _worker_graph = CSRGraph(N, *views)
+
+
+def _bfs_task(s: int) -> tuple[int, list[int]]:
+    dist, _, _ = bfs(_worker_graph, s)
+    return s, dist
+
+
+def _dijkstra_task(s: int) -> tuple[int, list]:
+    dist, _ = dijkstra(_worker_graph, s)
+    return s, dist
+
+
+def _run_batch(
+    G: Union[CSRGraph, CSRWeightedGraph],
+    task,
+    sources: Iterable[int],
+    processes: Optional[int],
+    chunksize: int,
+) -> Iterator[tuple[int, list]]:
+    with SharedCSR(G) as shared:
+        with Pool(processes, _init_worker, (shared.N, shared.specs)) as pool:
+            yield from pool.imap_unordered(task, sources, chunksize)
+
+
+def batch_bfs(
+    G: Union[Graph, CSRGraph],
+    sources: Iterable[int],
+    processes: Optional[int] = None,
+    chunksize: int = 8,
+) -> Iterator[tuple[int, list[int]]]:
+    """
+    複数の始点からの BFS をプロセスプールで並列に実行する
+
+    Args:
+        G: グラフ (隣接リストの場合は CSR に変換してから共有する)
+        sources: 始点のイテラブル
+        processes: ワーカー数 (省略時は CPU のコア数)
+        chunksize: 1 回にワーカーへ渡す始点の数
+
+    Yields:
+        (始点, 距離配列) (終わった順、距離は到達不能なら -1)
+    """
+    if not isinstance(G, CSRGraph):
+        G = CSRGraph.from_graph(G)
+    yield from _run_batch(G, _bfs_task, sources, processes, chunksize)
+
+
+def batch_dijkstra(
+    G: Union[WeightedGraph, CSRWeightedGraph],
+    sources: Iterable[int],
+    processes: Optional[int] = None,
+    chunksize: int = 8,
+) -> Iterator[tuple[int, list]]:
+    """
+    複数の始点からのダイクストラ法をプロセスプールで並列に実行する
+
+    Args:
+        G: 重み付きグラフ (隣接リストの場合は CSR に変換してから共有する)
+        sources: 始点のイテラブル
+        processes: ワーカー数 (省略時は CPU のコア数)
+        chunksize: 1 回にワーカーへ渡す始点の数
+
+    Yields:
+        (始点, 距離配列) (終わった順、距離は到達不能なら INF)
+    """
+    if not isinstance(G, CSRWeightedGraph):
+        G = CSRWeightedGraph.from_weighted_graph(G)
+    yield from _run_batch(G, _dijkstra_task, sources, processes, chunksize)
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 共有メモリ上のグラフに対するバッチ処理 ===\n")
+
+    edges = [(0, 1, 3), (0, 2, 5), (1, 2, 4), (1, 3, 12), (2, 3, 9), (2, 4, 4), (4, 3, 7)]
+    N = 5
+
+    G = read_graph_from_list(N, [(a, b) for a, b, _ in edges])
+    print("BFS:")
+    for s, dist in sorted(batch_bfs(G, range(N), processes=2)):
+        print(f"  始点 {s}: {dist}")
+
+    G_weighted = read_weighted_graph_from_list(N, edges)
+    print("ダイクストラ法:")
+    for s, dist in sorted(batch_dijkstra(G_weighted, range(N), processes=2)):
+        print(f"  始点 {s}: {dist}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+ベルマン・フォード法 (Bellman-Ford) による単一始点最短路と負閉路検出
+
+辺の重みが負でもよい重み付きグラフで、始点 s から各頂点への最短距離を求める。
+
+アルゴリズム:
+1. dist[s] = 0、それ以外は INF とする
+2. 全ての辺 (u, v, w) について dist[u] + w < dist[v] なら更新する (1 ラウンド)
+3. 負閉路がなければ高々 V - 1 ラウンドで更新が止まる
+4. V ラウンド目でも更新があれば、始点から到達可能な負閉路が存在する
+   (負閉路から到達できる頂点の最短距離は -INF)
+
+1 ラウンドで 1 度も更新がなければ、その時点で打ち切ってよい。
+
+実装:
+- bellman_ford: WeightedGraph 上の素朴な実装 (1 ラウンドが Python の二重ループ)
+- bellman_ford_vectorized: 辺を平坦な NumPy 配列 (src, dst, w) で持ち、
+  1 ラウンドの緩和を np.minimum.at の 1 回の呼び出しで行う
+
+時間計算量: O(VE)
+空間計算量: O(V + E)
+"""
+
+import numpy as np
+
+from structures.graph import WeightedGraph, read_weighted_graph_from_list
+
+INF = float("inf")
+
+
+def bellman_ford(G: WeightedGraph, s: int) -> tuple[list, bool]:
+    """
+    ベルマン・フォード法 (素朴な実装)
+
+    Args:
+        G: 重み付きグラフの隣接リスト (負の重みも可)
+        s: 始点
+
+    Returns:
+        タプル (dist, has_negative_cycle)
+        - dist[v]: s から v への最短距離
+                   (到達不能なら INF、負閉路を経由していくらでも小さくできるなら -INF)
+        - has_negative_cycle: s から到達可能な負閉路があるかどうか
+    """
+    N = len(G)
+    dist: list = [INF] * N
+    dist[s] = 0
+
+    # 負閉路がなければ N - 1 ラウンドで収束する。N ラウンド目の更新は負閉路の証拠
+    has_negative_cycle = False
+    for iteration in range(N):
+        updated = False
+        for v in range(N):
+            if dist[v] == INF:
+                continue
+            for edge in G[v]:
+                if dist[v] + edge.weight < dist[edge.to]:
+                    dist[edge.to] = dist[v] + edge.weight
+                    updated = True
+
+        if not updated:
+            break
+        if iteration == N - 1:
+            has_negative_cycle = True
+
+    if has_negative_cycle:
+        # さらに N ラウンド回し、更新され続ける頂点 (負閉路から到達可能) を -INF にする
+        for _ in range(N):
+            for v in range(N):
+                if dist[v] == INF:
+                    continue
+                for edge in G[v]:
+                    if dist[v] == -INF or dist[v] + edge.weight < dist[edge.to]:
+                        dist[edge.to] = -INF
+
+    return dist, has_negative_cycle
+
+
+def weighted_graph_to_arrays(
+    G: WeightedGraph,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    重み付きグラフを平坦な辺配列 (src, dst, w) に変換する
+
+    Args:
+        G: 重み付きグラフの隣接リスト
+
+    Returns:
+        タプル (src, dst, w)
+        - src, dst: 辺の始点と終点 (int64)
+        - w: 辺の重み (float64)
+    """
+    src = np.fromiter((v for v in range(len(G)) for _ in G[v]), dtype=np.int64)
+    dst = np.fromiter((edge.to for edges in G for edge in edges), dtype=np.int64)
+    w = np.fromiter((edge.weight for edges in G for edge in edges), dtype=np.float64)
+    return src, dst, w
+
+
+def bellman_ford_vectorized(
+    N: int, src: np.ndarray, dst: np.ndarray, w: np.ndarray, s: int
+) -> tuple[np.ndarray, bool]:
+    """
+    ベルマン・フォード法 (NumPy によるベクトル化)
+
+    1 ラウンドの緩和:
+        cand = dist[src] + w           # 全ての辺について候補の距離を計算
+        np.minimum.at(new, dst, cand)  # 終点ごとに最小値をとる (同じ終点が複数あってもよい)
+
+    1 ラウンド内では前のラウンドの dist だけを使う (Jacobi 型) ので、
+    k ラウンド後には辺数 k 以下の経路の最短距離が求まっており、
+    負閉路がなければ高々 N - 1 ラウンドで収束する。
+
+    Args:
+        N: 頂点数
+        src, dst: 辺の始点と終点の配列
+        w: 辺の重みの配列 (float64 に変換して計算する。整数は 2^53 まで正確)
+        s: 始点
+
+    Returns:
+        タプル (dist, has_negative_cycle)
+        - dist: 各頂点への最短距離の float64 配列 (到達不能なら inf、負閉路の影響があれば -inf)
+        - has_negative_cycle: s から到達可能な負閉路があるかどうか
+
+    Examples:
+        >>> src, dst, w = np.array([0, 1]), np.array([1, 2]), np.array([4.0, -1.0])
+        >>> bellman_ford_vectorized(3, src, dst, w, 0)
+        (array([0., 4., 3.]), False)
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    w = np.asarray(w, dtype=np.float64)
+
+    dist = np.full(N, np.inf)
+    dist[s] = 0.0
+
+    changed = np.zeros(N, dtype=bool)
+    for _ in range(N):
+        new = dist.copy()
+        np.minimum.at(new, dst, dist[src] + w)
+        changed = new < dist
+        dist = new
+
+        # 更新がなければ打ち切る
+        if not changed.any():
+            return dist, False
+
+    # N ラウンド目でも更新があった: 負閉路が存在する
+    # 更新された頂点から到達できる頂点を全て -inf にする (到達可能な頂点の集合を広げていく)
+    neg = changed
+    while True:
+        reached = neg.copy()
+        reached[dst[neg[src]]] = True
+        if (reached == neg).all():
+            break
+        neg = reached
+
+    dist[neg] = -np.inf
+    return dist, True
+
+
+def main() -> None:
+    """使用例"""
+    print("=== ベルマン・フォード法 ===\n")
+
+    edges = [
+        (0, 1, 3),
+        (0, 3, 100),
+        (1, 2, 50),
+        (1, 3, 57),
+        (1, 4, -4),
+        (2, 3, -10),
+        (2, 4, -5),
+        (2, 5, 100),
+        (3, 1, -5),
+        (4, 2, 57),
+        (4, 3, 25),
+        (4, 5, 8),
+    ]
+    N = 6
+    G = read_weighted_graph_from_list(N, edges)
+
+    dist, has_negative_cycle = bellman_ford(G, 0)
+    print(f"素朴な実装:     dist = {dist}, 負閉路 = {has_negative_cycle}")
+
+    src, dst, w = weighted_graph_to_arrays(G)
+    dist_vec, has_negative_cycle = bellman_ford_vectorized(N, src, dst, w, 0)
+    print(f"ベクトル化版:   dist = {dist_vec.tolist()}, 負閉路 = {has_negative_cycle}")
+    print()
+
+    # 負閉路を含む例: 1 → 2 → 3 → 1 の重みの合計が負
+    edges_with_cycle = edges + [(3, 2, -50)]
+    G = read_weighted_graph_from_list(N, edges_with_cycle)
+    dist, has_negative_cycle = bellman_ford(G, 0)
+    print(f"負閉路あり (素朴):   dist = {dist}, 負閉路 = {has_negative_cycle}")
+
+    src, dst, w = weighted_graph_to_arrays(G)
+    dist_vec, has_negative_cycle = bellman_ford_vectorized(N, src, dst, w, 0)
+    print(f"負閉路あり (ベクトル): dist = {dist_vec.tolist()}, 負閉路 = {has_negative_cycle}")
+
+
+if __name__ == "__main__":
+    main()
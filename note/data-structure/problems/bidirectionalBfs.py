@@ -0,0 +1,172 @@
+"""
+双方向 BFS (Bidirectional BFS) による 2 頂点間の最短路
+
+重みなしグラフで s → t の最短距離だけが欲しい場合、s からの BFS は
+t より近い頂点を全て調べてしまう。s 側と t 側の両方から BFS を進め、
+探索範囲が出会ったところで止めれば、調べる頂点数を大きく減らせる
+(分岐数 b、距離 d のとき、おおよそ b^d から 2 b^(d/2) に減る)。
+
+アルゴリズム:
+1. s 側のフロンティア {s} と t 側のフロンティア {t} を用意する
+2. 小さい方のフロンティアを 1 段 (同じ距離の頂点全て) だけ広げる
+   - t 側は辺を逆向きにたどる (有向グラフでは逆隣接リストを使う)
+3. その段で相手側が訪問済みの頂点に出会ったら、出会った頂点のうち
+   距離の和が最小のものを選んで終了する
+4. どちらかのフロンティアが空になったら到達不能
+
+訪問済みの頂点は辞書で管理するので、1 回のクエリで使うメモリは
+調べた頂点数に比例する (頂点数 N の配列を毎回確保しない)。
+
+時間計算量: O(調べた頂点の次数の合計) (最悪 O(V + E))
+空間計算量: O(調べた頂点数)
+"""
+
+from typing import Optional
+
+from problems.graphSearch import bfs
+from structures.graph import Graph, read_graph_from_list, reverse_graph
+
+
+def bidirectional_bfs(
+    G: Graph, s: int, t: int, RG: Optional[Graph] = None, directed: bool = True
+) -> tuple[int, list[int], int]:
+    """
+    双方向 BFS で s → t の最短路を求める
+
+    Args:
+        G: グラフの隣接リスト
+        s: 始点
+        t: 終点
+        RG: G の逆隣接リスト (reverse_graph(G))
+            省略時は、有向グラフなら呼び出しのたびに reverse_graph(G) で作る
+            (同じグラフに何度も問い合わせるなら 1 回作って渡す)。無向グラフなら G 自身を使う
+        directed: 有向グラフかどうか (デフォルト: True、RG を渡した場合は使わない)
+
+    Returns:
+        タプル (dist, path, expanded)
+        - dist: s → t の最短距離 (辺の本数、到達不能なら -1)
+        - path: 最短路の頂点のリスト [s, ..., t] (到達不能なら空リスト)
+        - expanded: 隣接リストを調べた頂点の数 (探索量の目安)
+
+    Examples:
+        >>> G = read_graph_from_list(4, [(0, 1), (1, 2), (2, 3)], directed=False)
+        >>> bidirectional_bfs(G, 0, 3, directed=False)
+        (3, [0, 1, 2, 3], 3)
+    """
+    if RG is None:
+        # 無向グラフでは辺を逆にたどっても同じ隣接リストになる
+        RG = reverse_graph(G) if directed else G
+
+    if s == t:
+        return 0, [s], 0
+
+    # 各側の訪問済み頂点 → BFS 木での親 (s 側は前の頂点、t 側は次の頂点)
+    parent_s = {s: -1}
+    parent_t = {t: -1}
+    dist_s = {s: 0}
+    dist_t = {t: 0}
+    frontier_s = [s]
+    frontier_t = [t]
+    expanded = 0
+
+    while frontier_s and frontier_t:
+        # 小さい方のフロンティアを広げる
+        if len(frontier_s) <= len(frontier_t):
+            adj, parent, dist, other_dist, frontier = G, parent_s, dist_s, dist_t, frontier_s
+        else:
+            adj, parent, dist, other_dist, frontier = RG, parent_t, dist_t, dist_s, frontier_t
+
+        next_frontier = []
+        best = -1
+        meet = -1
+        for v in frontier:
+            expanded += 1
+            for to in adj[v]:
+                if to in dist:
+                    continue
+                dist[to] = dist[v] + 1
+                parent[to] = v
+                next_frontier.append(to)
+
+                # 相手側の探索範囲と出会った
+                if to in other_dist:
+                    total = dist[to] + other_dist[to]
+                    if best == -1 or total < best:
+                        best, meet = total, to
+
+        if meet != -1:
+            return best, _join_path(parent_s, parent_t, meet), expanded
+
+        if frontier is frontier_s:
+            frontier_s = next_frontier
+        else:
+            frontier_t = next_frontier
+
+    return -1, [], expanded
+
+
+def _join_path(parent_s: dict[int, int], parent_t: dict[int, int], meet: int) -> list[int]:
+    """出会った頂点 meet で s 側と t 側の経路をつなぐ"""
+    path = []
+    v = meet
+    while v != -1:
+        path.append(v)
+        v = parent_s[v]
+    path.reverse()
+
+    v = parent_t[meet]
+    while v != -1:
+        path.append(v)
+        v = parent_t[v]
+    return path
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 双方向 BFS ===\n")
+
+    edges = [
+        (0, 1),
+        (0, 2),
+        (1, 3),
+        (2, 3),
+        (3, 4),
+        (4, 5),
+        (5, 6),
+        (2, 7),
+        (7, 6),
+    ]
+    N = 8
+    G = read_graph_from_list(N, edges, directed=True)
+    RG = reverse_graph(G)
+
+    dist, path, expanded = bidirectional_bfs(G, 0, 6, RG)
+    print(f"0 → 6: 距離 = {dist}, 経路 = {path}, 調べた頂点数 = {expanded}")
+    dist, path, expanded = bidirectional_bfs(G, 6, 0, RG)
+    print(f"6 → 0: 距離 = {dist}, 経路 = {path}, 調べた頂点数 = {expanded}")
+    print()
+
+    # 通常の BFS との比較 (格子グラフの中央付近の 2 点)
+    W = 300
+    grid_edges = []
+    for i in range(W):
+        for j in range(W):
+            v = i * W + j
+            if j + 1 < W:
+                grid_edges.append((v, v + 1))
+            if i + 1 < W:
+                grid_edges.append((v, v + W))
+    grid = read_graph_from_list(W * W, grid_edges, directed=False)
+
+    s = (W // 2) * W + W // 2
+    t = s + 20
+    dist, _, expanded = bidirectional_bfs(grid, s, t, directed=False)
+    bfs_dist, _, order = bfs(grid, s)
+    print(f"{W}x{W} の格子で距離 {dist} の 2 点:")
+    print(f"  双方向 BFS: {expanded} 頂点")
+    print(f"  通常の BFS: {order.index(t) + 1} 頂点 (t を取り出すまで)")
+    assert dist == bfs_dist[t]
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,24 @@
 連結な無向グラフ G = (V, E) が与えられたとき、全ての橋を求める。
 橋とは、その辺を取り除いたらグラフが連結でなくなるような辺のこと。
 
-アルゴリズム: Union-Findベース
+アルゴリズム1: Union-Findベース (count_bridges)
 - 各辺について、その辺を除外した状態でUnion-Findを構築
 - 辺の両端点が同じ連結成分に属さない場合、その辺は橋
 - 時間計算量: O(|E|^2 * α(|V|)) (全ての辺をチェック)
 - 空間計算量: O(|V|)
+
+アルゴリズム2: lowlink ベース (find_bridges_and_articulation_points)
+- DFS 木を作り、各頂点の訪問順 ord と、後退辺を 1 本まで使って戻れる最小の ord (low) を求める
+- 木の辺 (p, v) は low[v] > ord[p] のとき橋
+- 頂点 p は low[v] >= ord[p] となる子 v を持つとき関節点 (根の場合は子が 2 つ以上)
+- 時間計算量: O(|V| + |E|)
+- 空間計算量: O(|V| + |E|)
 """
 
 import sys
 sys.path.append('../structures')
 from typing import List, Tuple
+from structures.graph import read_undirected_graph_from_list
 from structures.unionFind import UnionFind
 
 
@@ -50,3 +58,125 @@ def count_bridges(n: int, edges: List[Tuple[int, int]]) -> int:
             bridge_count += 1
 
     return bridge_count
+
+
+# ============================================================
+# 最適化版: lowlink
+# ============================================================
+
+
+def find_bridges_and_articulation_points(
+    n: int, edges: List[Tuple[int, int]]
+) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """
+    lowlink を使って橋と関節点を全て求める
+
+    ord[v]: DFS で v を訪問した順番
+    low[v]: v から DFS 木の辺を下り、後退辺を高々 1 本使って到達できる頂点の ord の最小値
+
+    DFS は明示的なスタックで行うので、大きなグラフでも再帰上限に引っかからない。
+    多重辺に対応するため、親へ戻る辺は「頂点」ではなく「辺の番号」で区別する
+    (同じ 2 頂点を結ぶ辺が 2 本あれば、もう 1 本は後退辺として扱われ橋にならない)。
+
+    Args:
+        n: 頂点数 (頂点は 0 から n-1 でラベル付けされている)
+        edges: 辺のリスト [(u, v), ...] (連結でなくてもよい)
+
+    Returns:
+        タプル (bridges, articulation_points)
+        - bridges: 橋になっている辺のリスト (edges 内の順)
+        - articulation_points: 関節点のリスト (昇順)
+
+    時間計算量: O(|V| + |E|)
+    """
+    G = read_undirected_graph_from_list(n, edges)
+    # edge_id[v][i] = G[v][i] に対応する辺の番号 (G と同じ順で作る)
+    edge_id: List[List[int]] = [[] for _ in range(n)]
+    for i, (a, b) in enumerate(edges):
+        edge_id[a].append(i)
+        edge_id[b].append(i)
+
+    ord_ = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    parent_edge = [-1] * n
+    # it[v] = 頂点 v の隣接リストで次に調べる位置
+    it = [0] * n
+
+    is_bridge = [False] * len(edges)
+    is_articulation = [False] * n
+    counter = 0
+
+    for root in range(n):
+        if ord_[root] != -1:
+            continue
+
+        ord_[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        stack = [root]
+
+        while stack:
+            v = stack[-1]
+
+            if it[v] < len(G[v]):
+                to = G[v][it[v]]
+                e = edge_id[v][it[v]]
+                it[v] += 1
+
+                # 親から来た辺そのものは使わない
+                if e == parent_edge[v]:
+                    continue
+
+                if ord_[to] == -1:
+                    # 木の辺: 子 to へ進む
+                    parent[to] = v
+                    parent_edge[to] = e
+                    ord_[to] = low[to] = counter
+                    counter += 1
+                    stack.append(to)
+                else:
+                    # 後退辺: low を更新
+                    low[v] = min(low[v], ord_[to])
+                continue
+
+            # v の探索が終わったので親に戻る
+            stack.pop()
+            p = parent[v]
+            if p == -1:
+                continue
+
+            low[p] = min(low[p], low[v])
+
+            # 子 v の部分木から p より上に戻れなければ (p, v) は橋
+            if low[v] > ord_[p]:
+                is_bridge[parent_edge[v]] = True
+
+            # 子 v の部分木から p を飛び越えて戻れなければ p は関節点
+            if p == root:
+                root_children += 1
+            elif low[v] >= ord_[p]:
+                is_articulation[p] = True
+
+        # 根は DFS 木の子が 2 つ以上あるときだけ関節点
+        if root_children >= 2:
+            is_articulation[root] = True
+
+    bridges = [edges[i] for i in range(len(edges)) if is_bridge[i]]
+    articulation_points = [v for v in range(n) if is_articulation[v]]
+    return bridges, articulation_points
+
+
+def count_bridges_optimal(n: int, edges: List[Tuple[int, int]]) -> int:
+    """
+    lowlink を使って橋の本数を求める (count_bridges の O(|V| + |E|) 版)
+
+    Args:
+        n: 頂点数 (頂点は 0 から n-1 でラベル付けされている)
+        edges: 辺のリスト [(u, v), ...]
+
+    Returns:
+        橋の本数
+    """
+    bridges, _ = find_bridges_and_articulation_points(n, edges)
+    return len(bridges)
@@ -19,12 +19,8 @@ def decayedBridge(N: int, edges: list[tuple[int, int]]):
             if i != j:
                 uf.unite(a, b)
 
-        count = 0
-        for x in range(N):
-            if uf.root(x) == x:
-                count += 1
-
-        t[i] = count
+        # 連結成分数は unite のたびに更新されている (根を数え直さない)
+        t[i] = uf.num_components
 
     return t
 
@@ -50,20 +46,17 @@ def decayedBridge_optimal(N: int, edges: list[tuple[int, int]]) -> list[int]:
     edgesN = len(edges)
     uf = UnionFind(N)
 
-    # 初期状態: 全頂点が孤立
-    component_count = N
+    # 初期状態: 全頂点が孤立（uf.num_components = N）
     result = []
 
     # 辺を逆順に処理
     for i in range(edgesN - 1, -1, -1):
         # i番目の辺を崩壊させた後の連結成分数を記録
-        result.append(component_count)
+        result.append(uf.num_components)
 
-        # 辺を追加（時間を逆行）
+        # 辺を追加（時間を逆行）。併合が起きれば連結成分が1つ減る
         u, v = edges[i]
-        if not uf.isSame(u, v):
-            uf.unite(u, v)
-            component_count -= 1  # 連結成分が1つ減る
+        uf.unite(u, v)
 
     # 結果を反転して返す
     return result[::-1]
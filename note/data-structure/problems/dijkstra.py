@@ -0,0 +1,151 @@
+"""
+ダイクストラ法 (Dijkstra's Algorithm) による単一始点最短路
+
+辺の重みが全て非負の重み付きグラフで、始点 s から各頂点への最短距離を求める。
+
+アルゴリズム:
+1. dist[s] = 0、それ以外は INF とし、s をヒープに入れる
+2. ヒープから距離最小の頂点 v を取り出す (この時点で dist[v] が確定)
+3. v から出る各辺 (v, to, w) について dist[v] + w < dist[to] なら更新 (緩和)
+4. ヒープが空になるまで 2, 3 を繰り返す
+
+ヒープの選び方:
+- heapq に (距離, 頂点) を毎回 push する方式 (遅延削除) では、
+  古い要素がヒープに残るためヒープのサイズが O(E) まで膨らむ
+- 添字付きヒープ (IndexedMinHeap) の decrease-key を使えば、
+  各頂点はヒープに高々 1 つしか存在せず、サイズは O(V) に収まる
+
+時間計算量: O((V + E) log V)
+空間計算量: O(V)
+"""
+
+from typing import Optional
+
+from structures.graph import WeightedGraph, read_weighted_graph_from_list
+from structures.heap import IndexedMinHeap
+
+INF = float("inf")
+
+
+def dijkstra(
+    G: WeightedGraph,
+    s: int,
+    target: Optional[int] = None,
+    max_dist: Optional[int] = None,
+) -> tuple[list, list[int]]:
+    """
+    始点 s から各頂点への最短距離を求める
+
+    Args:
+        G: 重み付きグラフの隣接リスト (辺の重みは非負)
+        s: 始点
+        target: 指定した場合、target の距離が確定した時点で探索を打ち切る
+        max_dist: 指定した場合、距離が max_dist を超える頂点は探索しない
+
+    Returns:
+        タプル (dist, parent)
+        - dist[v]: s から v への最短距離 (到達不能・打ち切りの場合は INF)
+        - parent[v]: 最短路木における v の親 (s や未到達の頂点は -1)
+
+    Raises:
+        ValueError: 負の重みの辺を見つけた場合
+
+    Examples:
+        >>> G = read_weighted_graph_from_list(3, [(0, 1, 4), (0, 2, 1), (2, 1, 2)])
+        >>> dijkstra(G, 0)
+        ([0, 3, 1], [-1, 2, 0])
+    """
+    N = len(G)
+    dist: list = [INF] * N
+    parent = [-1] * N
+
+    heap = IndexedMinHeap(N)
+    dist[s] = 0
+    heap.push(s, 0)
+
+    while not heap.is_empty():
+        v, d = heap.pop()
+
+        # 目的の頂点の距離が確定したら終了
+        if v == target:
+            break
+
+        for edge in G[v]:
+            if edge.weight < 0:
+                raise ValueError(f"Negative edge weight: ({v}, {edge.to}, {edge.weight})")
+
+            nd = d + edge.weight
+            if max_dist is not None and nd > max_dist:
+                continue
+
+            # 緩和: より短い経路が見つかったら更新 (ヒープ上では decrease-key)
+            if nd < dist[edge.to]:
+                dist[edge.to] = nd
+                parent[edge.to] = v
+                heap.push(edge.to, nd)
+
+    # 打ち切った場合、ヒープに残っている頂点の距離は確定していない
+    if target is not None:
+        for v in heap.heap:
+            dist[v] = INF
+            parent[v] = -1
+
+    return dist, parent
+
+
+def reconstruct_path(parent: list[int], s: int, t: int) -> list[int]:
+    """
+    parent 配列から s → t の経路を復元する
+
+    Args:
+        parent: dijkstra などが返す親の配列
+        s: 始点
+        t: 終点
+
+    Returns:
+        経路上の頂点のリスト [s, ..., t] (到達できない場合は空リスト)
+    """
+    path = []
+    v = t
+    while v != -1:
+        path.append(v)
+        if v == s:
+            return path[::-1]
+        v = parent[v]
+    return []
+
+
+def main() -> None:
+    """使用例"""
+    print("=== ダイクストラ法 ===\n")
+
+    edges = [
+        (0, 1, 3),
+        (0, 2, 5),
+        (1, 2, 4),
+        (1, 3, 12),
+        (2, 3, 9),
+        (2, 4, 4),
+        (4, 3, 7),
+        (3, 5, 2),
+        (4, 5, 8),
+    ]
+    N = 6
+    G = read_weighted_graph_from_list(N, edges)
+
+    dist, parent = dijkstra(G, 0)
+    for v in range(N):
+        print(f"  0 → {v}: 距離 = {dist[v]}, 経路 = {reconstruct_path(parent, 0, v)}")
+    print()
+
+    # 目的地を指定して途中で打ち切る
+    dist, parent = dijkstra(G, 0, target=3)
+    print(f"  target=3: 距離 = {dist[3]}, 経路 = {reconstruct_path(parent, 0, 3)}")
+
+    # 距離の上限を指定する
+    dist, _ = dijkstra(G, 0, max_dist=5)
+    print(f"  max_dist=5: {dist}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+オフライン動的連結性 (Offline Dynamic Connectivity)
+
+辺の追加・削除と、連結性・連結成分数の問い合わせが任意の順に並んだ操作列に、
+全ての操作を先に読んでから (オフラインで) 答える。
+
+decayedBridge_optimal の「逆順に辺を追加する」方法は削除だけの操作列にしか使えず、
+各時刻で UnionFind を作り直すと O(Q × E) かかる。
+
+アルゴリズム (時間軸上のセグメント木 + 巻き戻し可能な Union-Find):
+1. 各辺について「存在している時間の区間」を求める
+   (追加された時刻から削除された時刻まで。最後まで削除されなければ末尾まで)
+2. 問い合わせの番号を葉とするセグメント木を作り、各辺の区間を O(log Q) 個のノードに載せる
+3. 根から DFS し、ノードに入るときにそのノードの辺を全て unite し、
+   出るときに rollback で元に戻す
+   葉に着いたとき、Union-Find には「その問い合わせの時刻に存在する辺」がちょうど入っている
+
+時間計算量: O((Q + E) log Q log N)
+空間計算量: O(N + E log Q)
+"""
+
+from bisect import bisect_left
+from typing import Union
+
+from problems.decayedBridge import decayedBridge_optimal
+from structures.rollbackUnionFind import RollbackUnionFind
+
+# 操作の種類
+ADD = "add"  # (ADD, u, v): 辺 (u, v) を追加
+REMOVE = "remove"  # (REMOVE, u, v): 辺 (u, v) を削除
+QUERY = "query"  # (QUERY, u, v): u と v が連結か
+COUNT = "count"  # (COUNT,): 連結成分の個数
+
+
+def dynamic_connectivity(N: int, operations: list[tuple]) -> list[Union[bool, int]]:
+    """
+    辺の追加・削除を含む操作列に対して、全ての問い合わせにオフラインで答える
+
+    同じ辺を複数回追加した場合は多重辺として扱い、削除は 1 本ずつ行う。
+
+    Args:
+        N: 頂点数
+        operations: 操作のリスト
+            - (ADD, u, v): 辺 (u, v) を追加
+            - (REMOVE, u, v): 辺 (u, v) を削除
+            - (QUERY, u, v): u と v が連結かどうか
+            - (COUNT,): 連結成分の個数
+
+    Returns:
+        問い合わせ (QUERY, COUNT) の答えを操作列での順に並べたリスト
+        (QUERY は bool、COUNT は int)
+
+    Raises:
+        ValueError: 存在しない辺を削除した場合、または未知の操作の場合
+
+    Examples:
+        >>> ops = [(ADD, 0, 1), (QUERY, 0, 1), (REMOVE, 0, 1), (QUERY, 0, 1), (COUNT,)]
+        >>> dynamic_connectivity(2, ops)
+        [True, False, 2]
+    """
+    # 問い合わせの時刻 (操作列での位置)
+    query_times = [t for t, op in enumerate(operations) if op[0] in (QUERY, COUNT)]
+    Q = len(query_times)
+    if Q == 0:
+        return []
+
+    # 各辺が存在する時間の区間 [start, end) (操作列での位置) を求める
+    intervals: list[tuple[int, int, int, int]] = []
+    # 辺 (u, v) (u <= v) → 追加されたまま削除されていない時刻のリスト
+    alive: dict[tuple[int, int], list[int]] = {}
+    for t, op in enumerate(operations):
+        kind = op[0]
+        if kind == ADD or kind == REMOVE:
+            u, v = op[1], op[2]
+            key = (u, v) if u <= v else (v, u)
+            if kind == ADD:
+                alive.setdefault(key, []).append(t)
+            else:
+                if not alive.get(key):
+                    raise ValueError(f"Removing an edge that does not exist: ({u}, {v}) at {t}")
+                intervals.append((*key, alive[key].pop(), t))
+        elif kind != QUERY and kind != COUNT:
+            raise ValueError(f"Unknown operation: {op!r}")
+    for key, starts in alive.items():
+        for start in starts:
+            intervals.append((*key, start, len(operations)))
+
+    # セグメント木 (葉 i = i 番目の問い合わせ) に辺を載せる
+    size = 1
+    while size < Q:
+        size *= 2
+    edges_at: list[list[tuple[int, int]]] = [[] for _ in range(2 * size)]
+    for u, v, start, end in intervals:
+        # 区間 (start, end) に含まれる問い合わせの番号の範囲 [l, r)
+        l = bisect_left(query_times, start)
+        r = bisect_left(query_times, end)
+        l += size
+        r += size
+        while l < r:
+            if l & 1:
+                edges_at[l].append((u, v))
+                l += 1
+            if r & 1:
+                r -= 1
+                edges_at[r].append((u, v))
+            l >>= 1
+            r >>= 1
+
+    # 根から DFS (明示的なスタック)。ノードに入るときに unite し、出るときに rollback する
+    uf = RollbackUnionFind(N)
+    answers: list[Union[bool, int]] = []
+    # (ノード, 入るときなら -1 / 出るときなら入る前の snapshot)
+    stack = [(1, -1)]
+    while stack:
+        node, snap = stack.pop()
+        if snap >= 0:
+            uf.rollback(snap)
+            continue
+
+        stack.append((node, uf.snapshot()))
+        for u, v in edges_at[node]:
+            uf.unite(u, v)
+
+        if node >= size:
+            i = node - size
+            if i < Q:
+                op = operations[query_times[i]]
+                if op[0] == QUERY:
+                    answers.append(uf.isSame(op[1], op[2]))
+                else:
+                    answers.append(uf.num_components)
+        else:
+            # 左の子を先に処理する (問い合わせの順に答えが並ぶ)
+            stack.append((2 * node + 1, -1))
+            stack.append((2 * node, -1))
+
+    return answers
+
+
+def main() -> None:
+    """使用例"""
+    print("=== オフライン動的連結性 ===\n")
+
+    ops = [
+        (ADD, 0, 1),
+        (ADD, 1, 2),
+        (QUERY, 0, 2),  # True
+        (COUNT,),  # 3 ({0, 1, 2}, {3}, {4})
+        (REMOVE, 1, 2),
+        (QUERY, 0, 2),  # False
+        (ADD, 2, 3),
+        (ADD, 3, 0),
+        (QUERY, 0, 2),  # True (0 - 3 - 2)
+        (REMOVE, 0, 1),
+        (COUNT,),  # 3 ({0, 2, 3}, {1}, {4})
+    ]
+    answers = dynamic_connectivity(5, ops)
+    queries = [op for op in ops if op[0] in (QUERY, COUNT)]
+    for op, ans in zip(queries, answers):
+        print(f"  {op}: {ans}")
+    print()
+
+    # 辺を順に崩壊させる問題 (decayedBridge) も操作列で表せる
+    N = 4
+    edges = [(0, 1), (0, 2), (1, 2), (2, 3)]
+    ops = [(ADD, u, v) for u, v in edges]
+    for u, v in edges:
+        ops.append((REMOVE, u, v))
+        ops.append((COUNT,))
+    print(f"辺の崩壊後の連結成分数: {dynamic_connectivity(N, ops)}")
+    print(f"decayedBridge_optimal:    {decayedBridge_optimal(N, edges)}")
+
+
+if __name__ == "__main__":
+    main()
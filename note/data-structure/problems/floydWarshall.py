@@ -0,0 +1,161 @@
+"""
+フロイド・ワーシャル法 (Floyd-Warshall) による全点対間最短路
+
+dp[k][i][j] = 頂点 0, 1, ..., k-1 だけを経由してよいときの i → j の最短距離
+とすると、頂点 k を経由するかどうかで
+
+    dp[k + 1][i][j] = min(dp[k][i][j], dp[k][i][k] + dp[k][k][j])
+
+と更新できる。k の次元は使い回せるので、距離行列 1 つを N 回更新すればよい。
+
+ベクトル化:
+- 経由点 k を固定すると、i, j についての更新は
+  dist = minimum(dist, dist[:, k, None] + dist[None, k, :])
+  という行列全体の 1 回のブロードキャスト演算になる
+- 経由点 k の更新中、k 行目と k 列目は変化しない (dist[k][k] >= 0 の場合) ので、
+  行をブロックに分けて順に更新してもよい。ブロックを小さくすると
+  一時配列が block_size × N に収まり、キャッシュに載りやすくなる
+
+時間計算量: O(V^3) (V 回の O(V^2) 演算)
+空間計算量: O(V^2)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from structures.graph import WeightedGraph, read_weighted_graph_from_list
+
+
+def weighted_graph_to_matrix(G: WeightedGraph) -> np.ndarray:
+    """
+    重み付きグラフを距離行列に変換する
+
+    Args:
+        G: 重み付きグラフの隣接リスト
+
+    Returns:
+        N × N の float64 行列 (対角は 0、辺がなければ inf、多重辺は最小の重み)
+    """
+    N = len(G)
+    dist = np.full((N, N), np.inf)
+    np.fill_diagonal(dist, 0.0)
+
+    src = np.fromiter((v for v in range(N) for _ in G[v]), dtype=np.int64)
+    dst = np.fromiter((edge.to for edges in G for edge in edges), dtype=np.int64)
+    w = np.fromiter((edge.weight for edges in G for edge in edges), dtype=np.float64)
+    np.minimum.at(dist, (src, dst), w)
+
+    return dist
+
+
+def floyd_warshall(
+    G: WeightedGraph, block_size: Optional[int] = None
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    全点対間の最短距離と、経路復元用の次の頂点を求める
+
+    Args:
+        G: 重み付きグラフの隣接リスト (負の重みも可)
+        block_size: 1 回に更新する行数 (省略時は全行を一度に更新する)
+
+    Returns:
+        タプル (dist, nxt, has_negative_cycle)
+        - dist[i][j]: i → j の最短距離 (到達不能なら inf)
+        - nxt[i][j]: i → j の最短路で i の次に訪れる頂点 (到達不能なら -1)
+        - has_negative_cycle: 負閉路があるかどうか (ある場合 dist は意味を持たない)
+
+    Examples:
+        >>> G = read_weighted_graph_from_list(3, [(0, 1, 1), (1, 2, 2), (0, 2, 5)])
+        >>> dist, nxt, _ = floyd_warshall(G)
+        >>> dist[0].tolist(), nxt[0].tolist()
+        ([0.0, 1.0, 3.0], [0, 1, 1])
+    """
+    dist = weighted_graph_to_matrix(G)
+    N = dist.shape[0]
+    if block_size is None:
+        block_size = max(N, 1)
+
+    # 初期状態: 辺 i → j があれば次の頂点は j
+    nxt = np.where(np.isfinite(dist), np.arange(N)[None, :], -1)
+
+    for k in range(N):
+        row_k = dist[k, :].copy()
+        for lo in range(0, N, block_size):
+            hi = min(lo + block_size, N)
+            block = dist[lo:hi]
+
+            # 頂点 k を経由した場合の距離
+            cand = block[:, k, None] + row_k[None, :]
+            improved = cand < block
+
+            block[improved] = cand[improved]
+            # i → j の次の頂点は i → k の次の頂点と同じ
+            nxt[lo:hi] = np.where(improved, nxt[lo:hi, k, None], nxt[lo:hi])
+
+    has_negative_cycle = bool((np.diag(dist) < 0).any())
+    return dist, nxt, has_negative_cycle
+
+
+def reconstruct_path(nxt: np.ndarray, u: int, v: int) -> list[int]:
+    """
+    nxt 行列から u → v の最短路を復元する
+
+    Args:
+        nxt: floyd_warshall が返す次の頂点の行列
+        u: 始点
+        v: 終点
+
+    Returns:
+        経路上の頂点のリスト [u, ..., v] (到達できない場合は空リスト)
+
+    Raises:
+        ValueError: 経路が負閉路を通る場合 (最短路が定まらない)
+
+    単純な経路は高々 N - 1 本の辺しか通らないので、それを超えて
+    たどり続けたら nxt が閉路になっている (負閉路を通っている) と分かる。
+    """
+    if nxt[u, v] == -1:
+        return []
+    N = nxt.shape[0]
+    path = [u]
+    while u != v:
+        if len(path) > N:
+            raise ValueError(f"Path {path[0]} -> {v} passes through a negative cycle")
+        u = int(nxt[u, v])
+        path.append(u)
+    return path
+
+
+def main() -> None:
+    """使用例"""
+    print("=== フロイド・ワーシャル法 ===\n")
+
+    edges = [
+        (0, 1, 3),
+        (0, 2, 5),
+        (1, 2, 4),
+        (1, 3, 12),
+        (2, 3, 9),
+        (2, 4, 4),
+        (4, 3, 7),
+        (3, 5, 2),
+        (4, 5, 8),
+    ]
+    N = 6
+    G = read_weighted_graph_from_list(N, edges)
+
+    dist, nxt, has_negative_cycle = floyd_warshall(G)
+    print("距離行列:")
+    for i in range(N):
+        print("  " + " ".join(f"{d:>4}" if np.isfinite(d) else " INF" for d in dist[i]))
+    print(f"負閉路: {has_negative_cycle}")
+    print(f"0 → 5 の経路: {reconstruct_path(nxt, 0, 5)}")
+
+    # ブロックに分けても結果は同じ
+    dist_blocked, _, _ = floyd_warshall(G, block_size=2)
+    print(f"block_size=2 と一致: {np.array_equal(dist, dist_blocked)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+グラフ探索 (BFS / DFS) の非再帰実装
+
+Code 13.2, 13.3 の探索を、再帰を使わずにキュー・スタックで行う。
+
+- 幅優先探索 (BFS): キュー (Queue) を使い、始点に近い頂点から順に訪問する
+  → 辺の本数で測った最短距離が求まる
+- 深さ優先探索 (DFS): スタック (Stack) を使い、行けるところまで進んでから戻る
+
+再帰による DFS は Python の再帰上限 (約 1000) に引っかかるため、
+パス状の大きなグラフでは RecursionError になる。ここでは明示的なスタックを使う。
+
+内側のループでは頂点ごとのメモリ確保をしない:
+- 訪問済みフラグは bytearray (1 頂点 1 バイト)
+- キュー・スタックは頂点数分を事前に確保したもの (呼び出し側から渡して使い回せる)
+- 距離・親の配列も呼び出し側から渡せる。書き込むのは到達した頂点だけなので、
+  visited と一緒に使い回して全ての未訪問頂点から探索しても、全体で O(V + E) で済む
+
+時間計算量: O(V + E)
+空間計算量: O(V)
+"""
+
+from typing import Optional
+
+from structures.graph import Graph, read_graph_from_list, read_undirected_graph_from_list
+from structures.stackAndQueue import Queue, Stack
+
+
+def bfs(
+    G: Graph,
+    s: int,
+    visited: Optional[bytearray] = None,
+    queue: Optional[Queue] = None,
+    dist: Optional[list[int]] = None,
+    parent: Optional[list[int]] = None,
+) -> tuple[list[int], list[int], list[int]]:
+    """
+    幅優先探索
+
+    Args:
+        G: グラフの隣接リスト
+        s: 始点
+        visited: 訪問済みフラグ (長さ N、省略時は新しく確保する)
+                 訪問した頂点には 1 が書き込まれる
+        queue: 作業用のキュー (max_size >= N + 1、省略時は新しく確保する)
+        dist: 距離を書き込む配列 (長さ N で -1 に初期化したもの、省略時は新しく確保する)
+        parent: 親を書き込む配列 (長さ N で -1 に初期化したもの、省略時は新しく確保する)
+                dist, parent には到達した頂点の分だけ書き込む
+
+    Returns:
+        タプル (dist, parent, order)
+        - dist[v]: s から v への最短距離 (辺の本数、到達不能なら -1)
+        - parent[v]: BFS 木における v の親 (s や未到達の頂点は -1)
+        - order: 訪問した順の頂点リスト
+
+    Examples:
+        >>> G = read_graph_from_list(4, [(0, 1), (0, 2), (2, 3)])
+        >>> bfs(G, 0)
+        ([0, 1, 1, 2], [-1, 0, 0, 2], [0, 1, 2, 3])
+    """
+    N = len(G)
+    if visited is None:
+        visited = bytearray(N)
+    if queue is None:
+        # リングバッファは MAX - 1 個までしか格納できない
+        queue = Queue(max_size=N + 1)
+    queue.init()
+    if dist is None:
+        dist = [-1] * N
+    if parent is None:
+        parent = [-1] * N
+    order = []
+
+    visited[s] = 1
+    dist[s] = 0
+    parent[s] = -1
+    queue.enqueue(s)
+
+    while not queue.is_empty():
+        v = queue.dequeue()
+        order.append(v)
+
+        for to in G[v]:
+            if visited[to]:
+                continue
+            visited[to] = 1
+            dist[to] = dist[v] + 1
+            parent[to] = v
+            queue.enqueue(to)
+
+    return dist, parent, order
+
+
+def dfs(
+    G: Graph,
+    s: int,
+    visited: Optional[bytearray] = None,
+    stack: Optional[Stack] = None,
+    depth: Optional[list[int]] = None,
+    parent: Optional[list[int]] = None,
+) -> tuple[list[int], list[int], list[int]]:
+    """
+    深さ優先探索 (非再帰)
+
+    再帰版と同じ順序 (隣接リストの先頭から) で頂点を訪問するため、
+    スタックには「頂点 v と、次に調べる隣接リストの位置」を積む。
+    頂点と位置を別々のスタックにすれば、タプルを作らずに済む。
+    位置のスタックは探索中の深さの分しか伸びないので、頂点数分の配列は確保しない。
+
+    Args:
+        G: グラフの隣接リスト
+        s: 始点
+        visited: 訪問済みフラグ (長さ N、省略時は新しく確保する)
+                 訪問した頂点には 1 が書き込まれる
+        stack: 作業用のスタック (max_size >= N、省略時は新しく確保する)
+        depth: 深さを書き込む配列 (長さ N で -1 に初期化したもの、省略時は新しく確保する)
+        parent: 親を書き込む配列 (長さ N で -1 に初期化したもの、省略時は新しく確保する)
+                depth, parent には到達した頂点の分だけ書き込む
+
+    Returns:
+        タプル (depth, parent, order)
+        - depth[v]: DFS 木における v の深さ (未到達なら -1)
+        - parent[v]: DFS 木における v の親 (s や未到達の頂点は -1)
+        - order: 訪問した順 (行きがけ順) の頂点リスト
+
+    Examples:
+        >>> G = read_graph_from_list(4, [(0, 1), (0, 2), (1, 3)])
+        >>> dfs(G, 0)
+        ([0, 1, 1, 2], [-1, 0, 0, 1], [0, 1, 3, 2])
+    """
+    N = len(G)
+    if visited is None:
+        visited = bytearray(N)
+    if stack is None:
+        stack = Stack(max_size=N)
+    stack.init()
+    if depth is None:
+        depth = [-1] * N
+    if parent is None:
+        parent = [-1] * N
+    order = []
+    # it[k] = スタックの k 番目の頂点の隣接リストで次に調べる位置
+    it = []
+
+    visited[s] = 1
+    depth[s] = 0
+    parent[s] = -1
+    order.append(s)
+    stack.push(s)
+    it.append(0)
+
+    while not stack.is_empty():
+        v = stack.peek()
+        neighbors = G[v]
+
+        # v の未訪問の隣接頂点を探す
+        i = it[-1]
+        while i < len(neighbors) and visited[neighbors[i]]:
+            i += 1
+        it[-1] = i + 1
+
+        if i == len(neighbors):
+            # 全て調べ終わったら戻る
+            stack.pop()
+            it.pop()
+            continue
+
+        to = neighbors[i]
+        visited[to] = 1
+        depth[to] = depth[v] + 1
+        parent[to] = v
+        order.append(to)
+        stack.push(to)
+        it.append(0)
+
+    return depth, parent, order
+
+
+def main() -> None:
+    """使用例"""
+    print("=== グラフ探索 (BFS / DFS) ===\n")
+
+    # Code 13.3 の例 (無向グラフ)
+    edges = [
+        (0, 5),
+        (1, 3),
+        (1, 6),
+        (2, 5),
+        (2, 7),
+        (3, 0),
+        (3, 7),
+        (4, 1),
+        (4, 2),
+        (4, 6),
+        (6, 7),
+        (7, 0),
+    ]
+    N = 8
+    G = read_undirected_graph_from_list(N, edges)
+
+    dist, parent, order = bfs(G, 0)
+    print(f"BFS 訪問順: {order}")
+    print(f"  距離: {dist}")
+    print(f"  親  : {parent}")
+
+    depth, parent, order = dfs(G, 0)
+    print(f"DFS 訪問順: {order}")
+    print(f"  深さ: {depth}")
+    print(f"  親  : {parent}")
+    print()
+
+    # キュー・visited・距離・親の配列を使い回して全頂点から探索する
+    # (各頂点は 1 回しか書き込まれないので、全体で O(V + E))
+    visited = bytearray(N)
+    queue = Queue(max_size=N + 1)
+    dist = [-1] * N
+    parent = [-1] * N
+    components = 0
+    for v in range(N):
+        if not visited[v]:
+            bfs(G, v, visited, queue, dist, parent)
+            components += 1
+    print(f"連結成分の個数: {components}")
+
+    # 再帰では RecursionError になる長いパス
+    n = 100000
+    path = read_graph_from_list(n, [(i, i + 1) for i in range(n - 1)])
+    depth, _, _ = dfs(path, 0)
+    print(f"長さ {n} のパスの DFS: 最大深さ = {depth[-1]}")
+
+
+if __name__ == "__main__":
+    main()
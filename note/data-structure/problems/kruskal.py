@@ -0,0 +1,149 @@
+"""
+クラスカル法 (Kruskal) による最小全域森
+
+重み付き無向グラフの全域木 (連結でなければ各連結成分の全域木の集まり = 全域森) のうち、
+辺の重みの総和が最小のものを求める。
+
+アルゴリズム:
+1. 辺を重みの小さい順に並べる
+2. 順に見ていき、両端点が別の連結成分なら採用する (Union-Find で判定・併合)
+3. 採用した辺が V - 1 本になったら打ち切る (それ以上採用できる辺はない)
+
+実装:
+- kruskal_naive: (重み, 辺番号) のタプルのリストを作ってソートする素朴な実装
+- kruskal: 辺を平行な配列 (src, dst, w) で受け取り、np.argsort 1 回で辺の順番だけを求める
+  (タプルを作らず、比較も NumPy 内で行うので、10^6 本規模で大きく速くなる)
+
+時間計算量: O(E log E)
+空間計算量: O(V + E)
+"""
+
+import time
+from typing import Sequence
+
+import numpy as np
+
+from structures.unionFind import UnionFind
+
+
+def kruskal_naive(N: int, edges: list[tuple[int, int, int]]) -> tuple[list[int], int]:
+    """
+    クラスカル法 (素朴な実装)
+
+    Args:
+        N: 頂点数
+        edges: 辺のリスト [(u, v, w), ...]
+
+    Returns:
+        タプル (chosen, total)
+        - chosen: 採用した辺の edges における番号 (採用順)
+        - total: 採用した辺の重みの総和
+    """
+    order = sorted((w, i) for i, (_, _, w) in enumerate(edges))
+
+    uf = UnionFind(N)
+    chosen = []
+    total = 0
+    for w, i in order:
+        u, v, _ = edges[i]
+        if uf.unite(u, v):
+            chosen.append(i)
+            total += w
+
+    return chosen, total
+
+
+def kruskal(
+    N: int, src: Sequence[int], dst: Sequence[int], w: Sequence[int]
+) -> tuple[list[int], int]:
+    """
+    クラスカル法 (辺を平行な配列で受け取る版)
+
+    Args:
+        N: 頂点数
+        src, dst: 辺の端点の配列 (リスト・array・NumPy 配列のいずれでもよい)
+        w: 辺の重みの配列
+
+    Returns:
+        タプル (chosen, total)
+        - chosen: 採用した辺の番号 (採用順)
+        - total: 採用した辺の重みの総和
+
+    Examples:
+        >>> kruskal(3, [0, 1, 0], [1, 2, 2], [1, 2, 5])
+        ([0, 1], 3)
+    """
+    w = np.asarray(w)
+    # 重みの小さい順の辺の番号 (同じ重みなら番号の小さい順)
+    order = np.argsort(w, kind="stable").tolist()
+
+    # ループ内で NumPy のスカラーを作らないよう Python のリストにしておく
+    src = np.asarray(src).tolist()
+    dst = np.asarray(dst).tolist()
+
+    uf = UnionFind(N)
+    unite = uf.unite
+    chosen = []
+    for i in order:
+        if unite(src[i], dst[i]):
+            chosen.append(i)
+            # 全域木の辺数に達したら残りの辺は見なくてよい
+            if len(chosen) == N - 1:
+                break
+
+    total = w[chosen].sum().item() if chosen else 0
+    return chosen, total
+
+
+def main() -> None:
+    """使用例"""
+    print("=== クラスカル法 ===\n")
+
+    edges = [
+        (0, 1, 7),
+        (0, 3, 5),
+        (1, 2, 8),
+        (1, 3, 9),
+        (1, 4, 7),
+        (2, 4, 5),
+        (3, 4, 15),
+        (3, 5, 6),
+        (4, 5, 8),
+        (4, 6, 9),
+        (5, 6, 11),
+    ]
+    N = 7
+
+    chosen, total = kruskal_naive(N, edges)
+    print(f"素朴な実装:   辺 = {[edges[i] for i in chosen]}, 重み = {total}")
+
+    src, dst, w = zip(*edges)
+    chosen, total = kruskal(N, src, dst, w)
+    print(f"配列版:       辺 = {[edges[i] for i in chosen]}, 重み = {total}")
+    print()
+
+    # 10^6 本の辺での比較
+    N = 10**5
+    M = 10**6
+    rng = np.random.default_rng(0)
+    src = rng.integers(0, N, M)
+    dst = rng.integers(0, N, M)
+    w = rng.integers(0, 10**9, M)
+    edges = list(zip(src.tolist(), dst.tolist(), w.tolist()))
+
+    start = time.perf_counter()
+    _, total_naive = kruskal_naive(N, edges)
+    naive_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, total = kruskal(N, src, dst, w)
+    sec = time.perf_counter() - start
+
+    print(f"V = {N}, E = {M}:")
+    print(f"  素朴な実装: {naive_sec:.2f} 秒")
+    print(f"  配列版:     {sec:.2f} 秒 ({naive_sec / sec:.1f} 倍)")
+    print(f"  重みの総和が一致: {total == total_naive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+到達可能性インデックス (推移閉包) を整数のビット集合で求める
+
+「頂点 u から頂点 v に到達できるか」を大量に問い合わせる場合、
+毎回 BFS するのではなく、各頂点から到達できる頂点の集合を前計算しておく。
+
+アルゴリズム:
+1. 強連結成分分解で DAG に縮約する (DAG ならそのまま各頂点が 1 成分になる)
+   成分番号はトポロジカル順なので、辺は常に番号の小さい成分から大きい成分へ向かう
+2. 成分を番号の大きい順 (トポロジカル順の逆) に処理し、
+   reach[c] = (自分自身のビット) | (後続の成分 d の reach を d - c ビットずらしたものの OR)
+   とする。Python の int は任意長なので、1 つの int をビット集合として使える
+   - reach[c] の i ビット目は成分 c + i を表す (c 自身からの相対位置)
+   - 成分 c から到達できるのは番号 c 以上の成分だけなので、reach[c] は高々 (成分数 - c) ビット
+3. u から v に到達できる ⟺ comp[v] >= comp[u] かつ reach[comp[u]] の (comp[v] - comp[u]) ビット目が 1
+
+ビット集合の OR は C で実装された多倍長演算なので、1 頂点ずつ集合に追加するより桁違いに速い。
+
+時間計算量: 構築 O(V + E × V / 64)、問い合わせ O(1)
+空間計算量: O(V^2 / 8) バイト (最悪の場合)
+"""
+
+import sys
+
+from problems.stronglyConnectedComponents import condensation, scc
+from structures.graph import Graph, read_graph_from_list
+
+
+def estimate_closure_bytes(num_components: int) -> int:
+    """
+    最悪の場合 (全ての成分が後続の全ての成分に到達できる場合) のインデックスの大きさ
+
+    成分 c の集合は高々 b = num_components - c ビットの int で、CPython では
+    24 バイト + 30 ビットごとに 4 バイト (sys.getsizeof) になる。これを b = 1, ..., n で合計すると
+        Σ (24 + 4 ⌈b / 30⌉) <= 28 n + n (n + 1) / 15
+
+    Args:
+        num_components: 成分 (DAG の頂点) の数
+
+    Returns:
+        int オブジェクトのヘッダを含めたバイト数の上界
+    """
+    n = num_components
+    return 28 * n + n * (n + 1) // 15
+
+
+class ReachabilityIndex:
+    """
+    到達可能性の問い合わせに O(1) で答えるインデックス
+
+    Attributes:
+        comp: 各頂点の成分番号
+        reach: reach[c] = 成分 c から到達できる成分の集合 (i ビット目が成分 c + i を表すビット集合)
+    """
+
+    def __init__(self, G: Graph, max_bytes: int = 1 << 30) -> None:
+        """
+        インデックスを構築する
+
+        Args:
+            G: 有向グラフの隣接リスト (閉路があってもよい)
+            max_bytes: 最悪の場合の大きさがこれを超えるなら構築しない
+
+        Raises:
+            MemoryError: 最悪の場合の大きさが max_bytes を超える場合
+                         (reachable_chunked を使う)
+        """
+        num_components, self.comp = scc(G)
+        estimate = estimate_closure_bytes(num_components)
+        if estimate > max_bytes:
+            raise MemoryError(
+                f"Reachability index may need {estimate} bytes (> {max_bytes}); "
+                "use reachable_chunked instead"
+            )
+
+        DAG = condensation(G, num_components, self.comp)
+        reach = [0] * num_components
+        # 後続の成分は番号が大きいので、大きい順に処理すれば先に確定している
+        for c in range(num_components - 1, -1, -1):
+            bits = 1
+            for d in DAG[c]:
+                # reach[d] は d からの相対位置なので、c からの相対位置にずらす
+                bits |= reach[d] << (d - c)
+            reach[c] = bits
+        self.reach = reach
+
+    def can_reach(self, u: int, v: int) -> bool:
+        """
+        u から v に到達できるかどうか
+
+        時間計算量: O(1) (ビットの取り出し)
+        """
+        cu, cv = self.comp[u], self.comp[v]
+        return cv >= cu and (self.reach[cu] >> (cv - cu)) & 1 == 1
+
+    def count_reachable(self, u: int) -> int:
+        """u から到達できる成分の数 (u 自身の成分を含む)"""
+        return self.reach[self.comp[u]].bit_count()
+
+    def nbytes(self) -> int:
+        """ビット集合が実際に使用しているバイト数"""
+        return sum(sys.getsizeof(bits) for bits in self.reach)
+
+
+def reachable_chunked(
+    G: Graph, queries: list[tuple[int, int]], chunk_bits: int = 1 << 16
+) -> list[bool]:
+    """
+    インデックス全体を持たずに、到達可能性の問い合わせにまとめて答える
+
+    行き先の成分を chunk_bits 個ずつの区間 [lo, hi) に分け、区間ごとに
+    「区間内の成分のうち到達できるもの」だけのビット集合を作って問い合わせに答える。
+    同時に持つのは 1 区間分 (成分数 × chunk_bits ビット) だけで済む。
+
+    Args:
+        G: 有向グラフの隣接リスト
+        queries: 問い合わせのリスト [(u, v), ...]
+        chunk_bits: 1 区間あたりの成分数
+
+    Returns:
+        各問い合わせについて u から v に到達できるかどうか
+
+    時間計算量: O((V + E) × (V / chunk_bits) + Q)
+    """
+    num_components, comp = scc(G)
+    DAG = condensation(G, num_components, comp)
+
+    # 行き先の成分ごとに問い合わせを振り分ける
+    by_target: list[list[int]] = [[] for _ in range(num_components)]
+    for i, (_, v) in enumerate(queries):
+        by_target[comp[v]].append(i)
+
+    answers = [False] * len(queries)
+    for lo in range(0, num_components, chunk_bits):
+        hi = min(lo + chunk_bits, num_components)
+
+        # 成分 hi 以降からは区間 [lo, hi) に到達できない (辺は番号の大きい方へ向かう)
+        reach = [0] * hi
+        for c in range(hi - 1, -1, -1):
+            bits = 1 << (c - lo) if c >= lo else 0
+            for d in DAG[c]:
+                if d < hi:
+                    bits |= reach[d]
+            reach[c] = bits
+
+        for t in range(lo, hi):
+            for i in by_target[t]:
+                cu = comp[queries[i][0]]
+                answers[i] = cu < hi and (reach[cu] >> (t - lo)) & 1 == 1
+
+    return answers
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 到達可能性インデックス ===\n")
+
+    # 依存関係の DAG
+    edges = [
+        (0, 1),
+        (0, 2),
+        (1, 3),
+        (2, 3),
+        (3, 4),
+        (5, 4),
+        (5, 6),
+    ]
+    N = 7
+    G = read_graph_from_list(N, edges, directed=True)
+
+    print(f"最悪の場合の大きさ: {estimate_closure_bytes(N)} バイト")
+    index = ReachabilityIndex(G)
+    print(f"実際の大きさ: {index.nbytes()} バイト")
+
+    queries = [(0, 4), (0, 5), (5, 4), (4, 0), (6, 6)]
+    for u, v in queries:
+        print(f"  {u} → {v}: {index.can_reach(u, v)}")
+    print(f"  頂点 0 から到達できる成分数: {index.count_reachable(0)}")
+
+    answers = reachable_chunked(G, queries, chunk_bits=2)
+    print(f"分割版と一致: {answers == [index.can_reach(u, v) for u, v in queries]}")
+
+
+if __name__ == "__main__":
+    main()
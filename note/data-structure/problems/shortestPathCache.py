@@ -0,0 +1,213 @@
+"""
+単一始点最短路の結果キャッシュ
+
+辺の追加はまれで、同じ始点への問い合わせが繰り返される場合、
+BFS / ダイクストラ法を毎回やり直すのは無駄になる。
+
+方針:
+- (グラフ, 探索の種類, 始点) ごとに (距離, 親) の配列を保存する
+- 容量を超えたら最も長く使われていない結果から捨てる (LRU)
+- グラフの版番号 (structures.graph.graph_version) も一緒に記録しておき、
+  add_edge / add_weighted_edge で版番号が変わったグラフの結果はまとめて捨てる
+- グラフへの参照と版番号の監視は、そのグラフの結果が 1 つでも残っている間だけ持つ
+  (結果が全て捨てられたグラフは解放される)
+
+時間計算量: キャッシュヒット時 O(1)、ミス時は元の探索と同じ
+空間計算量: O(capacity × V)
+"""
+
+import sys
+from collections import OrderedDict
+
+from problems.dijkstra import dijkstra
+from problems.graphSearch import bfs
+from structures.graph import (
+    Graph,
+    WeightedGraph,
+    add_edge,
+    add_weighted_edge,
+    graph_version,
+    read_graph_from_list,
+    read_weighted_graph_from_list,
+    unwatch_graph_version,
+    watch_graph_version,
+)
+
+
+class ShortestPathCache:
+    """
+    BFS / ダイクストラ法の結果を LRU で保持するキャッシュ
+
+    返す配列はキャッシュ内の配列そのものなので、呼び出し側で書き換えないこと。
+    結果が残っているグラフへの参照を持つ (id の再利用を防ぐため) ので、
+    キャッシュごと不要になったら clear() で解放する。
+
+    Attributes:
+        capacity: 保持する結果の最大数
+        hits: キャッシュにあった回数
+        misses: キャッシュになかった回数
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        """
+        キャッシュを初期化する
+
+        Args:
+            capacity: 保持する結果の最大数
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        # (id(G), 種類, 始点) → (距離, 親)。末尾ほど最近使われた
+        self._entries: OrderedDict = OrderedDict()
+        # id(G) → (G, 結果を保存したときの版番号)。結果が残っているグラフだけ持つ
+        self._graphs: dict[int, tuple[object, int]] = {}
+        # id(G) → そのグラフの結果の数
+        self._counts: dict[int, int] = {}
+
+    def _lookup(self, G, kind: str, s: int):
+        """キャッシュを調べ、なければ None を返す"""
+        gid = id(G)
+
+        # グラフが変更されていたら、そのグラフの結果を全て捨てる
+        if gid in self._graphs and self._graphs[gid][1] != graph_version(G):
+            self._drop_graph(gid)
+
+        key = (gid, kind, s)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def _store(self, G, kind: str, s: int, result) -> None:
+        """結果を保存し、容量を超えたら古いものから捨てる"""
+        gid = id(G)
+        if gid not in self._graphs:
+            self._graphs[gid] = (G, watch_graph_version(G))
+            self._counts[gid] = 0
+        self._entries[(gid, kind, s)] = result
+        self._counts[gid] += 1
+
+        while len(self._entries) > self.capacity:
+            (old_gid, _, _), _ = self._entries.popitem(last=False)
+            self._counts[old_gid] -= 1
+            # 結果が全て捨てられたグラフは手放す
+            if self._counts[old_gid] == 0:
+                self._forget_graph(old_gid)
+
+    def _drop_graph(self, gid: int) -> None:
+        """グラフの結果を全て捨て、グラフを手放す"""
+        for key in [key for key in self._entries if key[0] == gid]:
+            del self._entries[key]
+        self._forget_graph(gid)
+
+    def _forget_graph(self, gid: int) -> None:
+        G, _ = self._graphs.pop(gid)
+        del self._counts[gid]
+        unwatch_graph_version(G)
+
+    def bfs(self, G: Graph, s: int) -> tuple[list[int], list[int]]:
+        """
+        BFS の結果を返す (キャッシュになければ計算する)
+
+        Args:
+            G: グラフの隣接リスト
+            s: 始点
+
+        Returns:
+            タプル (dist, parent) (problems.graphSearch.bfs と同じ)
+        """
+        result = self._lookup(G, "bfs", s)
+        if result is None:
+            dist, parent, _ = bfs(G, s)
+            result = (dist, parent)
+            self._store(G, "bfs", s, result)
+        return result
+
+    def dijkstra(self, G: WeightedGraph, s: int) -> tuple[list, list[int]]:
+        """
+        ダイクストラ法の結果を返す (キャッシュになければ計算する)
+
+        Args:
+            G: 重み付きグラフの隣接リスト
+            s: 始点
+
+        Returns:
+            タプル (dist, parent) (problems.dijkstra.dijkstra と同じ)
+        """
+        result = self._lookup(G, "dijkstra", s)
+        if result is None:
+            result = dijkstra(G, s)
+            self._store(G, "dijkstra", s, result)
+        return result
+
+    @property
+    def hit_rate(self) -> float:
+        """キャッシュのヒット率 (問い合わせがなければ 0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def nbytes(self) -> int:
+        """
+        保持している結果のおおよそのバイト数
+
+        リスト本体 (要素へのポインタ) の大きさで数える。
+        要素の int オブジェクトは小さい値なら共有されるので含めない。
+        参照を持っているグラフの隣接リストも同じ数え方で含める。
+        """
+        results = sum(
+            sys.getsizeof(dist) + sys.getsizeof(parent)
+            for dist, parent in self._entries.values()
+        )
+        graphs = sum(
+            sys.getsizeof(G) + sum(sys.getsizeof(adj) for adj in G)
+            for G, _ in self._graphs.values()
+        )
+        return results + graphs
+
+    def clear(self) -> None:
+        """全ての結果とグラフへの参照を捨てる"""
+        for gid in list(self._graphs):
+            self._forget_graph(gid)
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"ShortestPathCache(size={len(self)}/{self.capacity}, "
+            f"hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.2f})"
+        )
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 最短路キャッシュ ===\n")
+
+    cache = ShortestPathCache(capacity=2)
+
+    G = read_graph_from_list(4, [(0, 1), (1, 2)])
+    print(f"bfs(0) = {cache.bfs(G, 0)[0]}")
+    print(f"bfs(0) = {cache.bfs(G, 0)[0]}  (キャッシュ)")
+
+    # 辺を追加すると古い結果は使われない
+    add_edge(G, 2, 3)
+    print(f"辺 (2, 3) を追加 → bfs(0) = {cache.bfs(G, 0)[0]}")
+    print(f"  {cache}")
+    print()
+
+    G_weighted = read_weighted_graph_from_list(3, [(0, 1, 5), (1, 2, 1)])
+    for s in [0, 1, 0, 2, 0]:
+        dist, _ = cache.dijkstra(G_weighted, s)
+        print(f"dijkstra({s}) = {dist}")
+    add_weighted_edge(G_weighted, 0, 2, 2)
+    print(f"辺 (0, 2, 2) を追加 → dijkstra(0) = {cache.dijkstra(G_weighted, 0)[0]}")
+    print(f"  {cache}, 約 {cache.nbytes()} バイト")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+強連結成分分解 (Strongly Connected Components, SCC)
+
+有向グラフにおいて、互いに行き来できる頂点の極大な集合を強連結成分という。
+各強連結成分を 1 頂点に縮約したグラフ (縮約グラフ) は DAG になる。
+
+アルゴリズム: Kosaraju のアルゴリズム
+1. G 上で DFS を行い、帰りがけ順 (探索を終えた順) を記録する
+2. 全ての辺を反転したグラフ RG 上で、帰りがけ順の遅い頂点から DFS を行う
+3. 2 回目の DFS で 1 回に到達できる頂点の集合が 1 つの強連結成分
+
+成分番号は縮約グラフのトポロジカル順 (成分 i → 成分 j の辺があれば i < j) になる。
+DFS はどちらも明示的なスタックで行うので、数百万頂点でも再帰上限に引っかからない。
+
+時間計算量: O(V + E)
+空間計算量: O(V + E)
+"""
+
+from structures.graph import Graph, read_graph_from_list, reverse_graph
+
+
+def scc(G: Graph) -> tuple[int, list[int]]:
+    """
+    強連結成分分解を行う
+
+    Args:
+        G: 有向グラフの隣接リスト
+
+    Returns:
+        タプル (num_components, comp)
+        - num_components: 強連結成分の個数
+        - comp[v]: 頂点 v が属する成分の番号 (縮約グラフのトポロジカル順)
+
+    Examples:
+        >>> G = read_graph_from_list(4, [(0, 1), (1, 0), (1, 2), (2, 3)])
+        >>> scc(G)
+        (3, [0, 0, 1, 2])
+    """
+    N = len(G)
+
+    # 1. G 上の DFS で帰りがけ順を求める
+    visited = bytearray(N)
+    # it[v] = 頂点 v の隣接リストで次に調べる位置
+    it = [0] * N
+    postorder = []
+
+    for s in range(N):
+        if visited[s]:
+            continue
+        visited[s] = 1
+        stack = [s]
+        while stack:
+            v = stack[-1]
+            if it[v] < len(G[v]):
+                to = G[v][it[v]]
+                it[v] += 1
+                if not visited[to]:
+                    visited[to] = 1
+                    stack.append(to)
+            else:
+                # v から行ける頂点を全て調べ終えた
+                stack.pop()
+                postorder.append(v)
+
+    # 2. 逆グラフ上で、帰りがけ順の遅い頂点から DFS する
+    RG = reverse_graph(G)
+    comp = [-1] * N
+    num_components = 0
+
+    for s in reversed(postorder):
+        if comp[s] != -1:
+            continue
+        comp[s] = num_components
+        stack = [s]
+        while stack:
+            v = stack.pop()
+            for to in RG[v]:
+                if comp[to] == -1:
+                    comp[to] = num_components
+                    stack.append(to)
+        num_components += 1
+
+    return num_components, comp
+
+
+def condensation(G: Graph, num_components: int, comp: list[int]) -> Graph:
+    """
+    強連結成分を 1 頂点に縮約したグラフ (DAG) を作る
+
+    Args:
+        G: 有向グラフの隣接リスト
+        num_components: 強連結成分の個数
+        comp: 各頂点の成分番号 (scc の戻り値)
+
+    Returns:
+        縮約グラフの隣接リスト (自己ループと重複辺は除く)
+
+    時間計算量: O(V + E)
+    """
+    DAG: Graph = [[] for _ in range(num_components)]
+    # 追加済みの辺 (cv, ct) を cv * num_components + ct に符号化して記録する
+    seen = set()
+
+    for v in range(len(G)):
+        cv = comp[v]
+        for to in G[v]:
+            ct = comp[to]
+            key = cv * num_components + ct
+            if cv != ct and key not in seen:
+                seen.add(key)
+                DAG[cv].append(ct)
+
+    return DAG
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 強連結成分分解 ===\n")
+
+    edges = [
+        (0, 1),
+        (1, 2),
+        (2, 0),
+        (1, 3),
+        (3, 4),
+        (4, 5),
+        (5, 3),
+        (6, 5),
+        (6, 7),
+        (7, 6),
+    ]
+    N = 8
+    G = read_graph_from_list(N, edges, directed=True)
+
+    num_components, comp = scc(G)
+    print(f"強連結成分の個数: {num_components}")
+    for c in range(num_components):
+        members = [v for v in range(N) if comp[v] == c]
+        print(f"  成分 {c}: {members}")
+
+    DAG = condensation(G, num_components, comp)
+    print(f"縮約グラフ: {DAG}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+トポロジカルソートと閉路検出
+
+有向グラフの頂点を、全ての辺 u → v について u が v より前に来るように並べる。
+このような並びが存在する ⟺ グラフが DAG (有向閉路を持たない)。
+
+アルゴリズム: Kahn のアルゴリズム
+1. 各頂点の入次数を求める
+2. 入次数 0 の頂点をキューに入れる
+3. キューから頂点 v を取り出して出力し、v から出る辺を削除する
+   (削除によって入次数が 0 になった頂点をキューに入れる)
+4. 全頂点を出力できなければ、残った頂点の中に閉路がある
+
+再帰を使わないので、数百万頂点のグラフでも安全に動作する。
+
+時間計算量: O(V + E)
+空間計算量: O(V + E)
+"""
+
+from typing import Optional
+
+from structures.graph import DegreeIndex, Graph, read_graph_from_list
+
+
+def topological_sort(G: Graph) -> tuple[list[int], Optional[list[int]]]:
+    """
+    Kahn のアルゴリズムでトポロジカルソートを行う
+
+    Args:
+        G: 有向グラフの隣接リスト
+
+    Returns:
+        タプル (order, cycle)
+        - order: トポロジカル順に並べた頂点のリスト
+                 (閉路がある場合は、閉路に関係しない頂点だけの途中結果)
+        - cycle: 閉路がある場合はその閉路 [v0, v1, ..., vk] (vk → v0 の辺で閉じる)、
+                 DAG の場合は None
+
+    Examples:
+        >>> G = read_graph_from_list(3, [(2, 0), (0, 1)])
+        >>> topological_sort(G)
+        ([2, 0, 1], None)
+        >>> G = read_graph_from_list(3, [(0, 1), (1, 2), (2, 1)])
+        >>> topological_sort(G)
+        ([0], [2, 1])
+    """
+    N = len(G)
+    index = DegreeIndex(G)
+    in_deg = index.in_deg[:]
+
+    # order 自体をキューとして使う (head より後ろが未処理)
+    order = [v for v in range(N) if in_deg[v] == 0]
+    head = 0
+    while head < len(order):
+        v = order[head]
+        head += 1
+        for to in G[v]:
+            in_deg[to] -= 1
+            if in_deg[to] == 0:
+                order.append(to)
+
+    if len(order) == N:
+        return order, None
+
+    return order, _find_cycle(index, in_deg)
+
+
+def _find_cycle(index: DegreeIndex, in_deg: list[int]) -> list[int]:
+    """
+    Kahn のアルゴリズムで取り除けなかった頂点から閉路を 1 つ見つける
+
+    残った頂点 (in_deg > 0) は必ず残った頂点からの入辺を持つので、
+    入辺を逆向きにたどり続ければいつか同じ頂点に戻ってくる。
+    """
+    v = next(v for v in range(len(in_deg)) if in_deg[v] > 0)
+
+    # 逆向きにたどり、2 回目に訪れた頂点で閉路が閉じる
+    pos = {}
+    walk = []
+    while v not in pos:
+        pos[v] = len(walk)
+        walk.append(v)
+        v = next(u for u in index.predecessors(v) if in_deg[u] > 0)
+
+    # 逆向きにたどったので、向きを戻す
+    return walk[pos[v]:][::-1]
+
+
+def is_dag(G: Graph) -> bool:
+    """
+    有向グラフが DAG (閉路を持たない) かどうか判定する
+
+    Args:
+        G: 有向グラフの隣接リスト
+
+    Returns:
+        DAG なら True
+    """
+    _, cycle = topological_sort(G)
+    return cycle is None
+
+
+def main() -> None:
+    """使用例"""
+    print("=== トポロジカルソート ===\n")
+
+    # 依存関係 (a → b: a の後に b)
+    edges = [
+        (5, 2),
+        (5, 0),
+        (4, 0),
+        (4, 1),
+        (2, 3),
+        (3, 1),
+    ]
+    N = 6
+    G = read_graph_from_list(N, edges, directed=True)
+    order, cycle = topological_sort(G)
+    print(f"トポロジカル順: {order}")
+    print(f"閉路: {cycle}")
+    print()
+
+    # 閉路を含む例
+    edges_with_cycle = edges + [(1, 5)]
+    G = read_graph_from_list(N, edges_with_cycle, directed=True)
+    order, cycle = topological_sort(G)
+    print(f"辺 (1, 5) を追加 → DAG? {is_dag(G)}")
+    print(f"  途中までの順序: {order}")
+    print(f"  見つかった閉路: {cycle}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ Code 10.2, 10.3: グラフを隣接リストとして入力・構築する
    - 辺の存在確認が高速: O(1)
    - メモリ使用量が大きい: O(V^2)
 
+3. CSR (Compressed Sparse Row): CSRGraph
+   - 隣接リストを 2 本の平坦な整数配列 (offsets, targets) に詰めたもの
+   - 頂点 v の隣接頂点 = targets[offsets[v]:offsets[v + 1]]
+   - 辺ごとの Python オブジェクトが不要なのでメモリが数分の一になる
+   - 隣接頂点が連続領域に並ぶので走査が速い (構築後は変更不可)
+
 入力形式 (Code 10.2):
 - 1行目: N (頂点数), M (辺数)
 - 2行目以降: a, b (辺 a→b)
@@ -22,7 +28,15 @@ Code 10.2, 10.3: グラフを隣接リストとして入力・構築する
 空間計算量: O(N + M) (隣接リスト)
 """
 
-from typing import Optional, NamedTuple
+import mmap
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import islice, repeat
+from operator import mul
+from typing import BinaryIO, Iterable, Iterator, Optional, NamedTuple
 
 # グラフの型定義
 
@@ -32,7 +46,199 @@ from typing import Optional, NamedTuple
 Graph = list[list[int]]
 
 
-# 2. 重み付きグラフ (Weighted Graph)
+# 2. CSR 形式のグラフ (Compressed Sparse Row)
+class CSRGraph:
+    """
+    CSR 形式で表現した重みなしグラフ
+
+    隣接リスト list[list[int]] はポインタ 8 バイト + 辺ごとの int オブジェクト
+    + 頂点ごとのリストヘッダを消費する。CSR では辺 1 本あたり 4 バイト
+    (targets の int32) と頂点 1 つあたり 8 バイト (offsets の int64) で済む。
+
+    G[v] / len(G) / for neighbors in G に対応しているので、
+    Graph を受け取る既存の関数 (visualize_graph, count_edges など) にそのまま渡せる。
+
+    Attributes:
+        N: 頂点数
+        offsets: 長さ N + 1 の配列 (頂点 v の辺は offsets[v] から offsets[v + 1] - 1)
+        targets: 長さ M の配列 (辺の終点を始点の順に並べたもの)
+    """
+
+    # targets は int32 (頂点数 2^31 未満を想定)、offsets は辺数が大きくなるので int64
+    TARGET_TYPECODE = "i"
+    OFFSET_TYPECODE = "q"
+
+    def __init__(self, N: int, offsets: array, targets: array) -> None:
+        """
+        CSR グラフを初期化する
+
+        Args:
+            N: 頂点数
+            offsets: 長さ N + 1 のオフセット配列
+            targets: 長さ offsets[N] の終点配列
+
+        通常は from_edges / from_graph から構築する
+        """
+        if len(offsets) != N + 1 or offsets[N] != len(targets):
+            raise ValueError("Invalid CSR arrays: offsets and targets do not match")
+
+        self.N = N
+        self.offsets = offsets
+        self.targets = targets
+        # 隣接頂点をコピーなしで切り出すためのビュー
+        self._view = memoryview(targets)
+
+    @classmethod
+    def from_edges(
+        cls, N: int, edges: list[tuple[int, int]], directed: bool = True
+    ) -> "CSRGraph":
+        """
+        辺のリストから CSR グラフを構築する (計数ソート)
+
+        1. 各頂点の出次数を数える
+        2. 累積和で offsets を求める
+        3. 各辺を始点の区間に書き込む
+
+        隣接頂点の順序は read_graph_from_list と同じになる
+
+        Args:
+            N: 頂点数
+            edges: 辺のリスト [(a, b), ...]
+            directed: 有向グラフかどうか (デフォルト: True)
+
+        Returns:
+            CSR グラフ
+
+        Examples:
+            >>> G = CSRGraph.from_edges(8, [(4, 1), (4, 2), (4, 6)])
+            >>> list(G[4])
+            [1, 2, 6]
+
+        時間計算量: O(N + M)
+        """
+        # 1. 出次数を数える
+        offsets = array(cls.OFFSET_TYPECODE, bytes(8 * (N + 1)))
+        for a, b in edges:
+            offsets[a + 1] += 1
+            if not directed:
+                offsets[b + 1] += 1
+
+        # 2. 累積和: offsets[v] = 頂点 v の区間の先頭
+        for v in range(N):
+            offsets[v + 1] += offsets[v]
+
+        # 3. 各頂点の書き込み位置を進めながら終点を詰める
+        pos = offsets[:-1]
+        targets = array(cls.TARGET_TYPECODE, bytes(4 * offsets[N]))
+        for a, b in edges:
+            targets[pos[a]] = b
+            pos[a] += 1
+
+            # 無向グラフの場合は逆辺も追加
+            if not directed:
+                targets[pos[b]] = a
+                pos[b] += 1
+
+        return cls(N, offsets, targets)
+
+    @classmethod
+    def from_graph(cls, G: Graph) -> "CSRGraph":
+        """
+        隣接リストから CSR グラフに変換する
+
+        Args:
+            G: グラフの隣接リスト
+
+        Returns:
+            同じ辺 (同じ順序) を持つ CSR グラフ
+
+        時間計算量: O(N + M)
+        """
+        N = len(G)
+        offsets = array(cls.OFFSET_TYPECODE, [0])
+        targets = array(cls.TARGET_TYPECODE)
+        for neighbors in G:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+
+        return cls(N, offsets, targets)
+
+    def to_graph(self) -> Graph:
+        """
+        隣接リスト表現に戻す
+
+        Returns:
+            グラフの隣接リスト
+        """
+        return [self[v].tolist() for v in range(self.N)]
+
+    def neighbors(self, v: int) -> memoryview:
+        """
+        頂点 v の隣接頂点をコピーなしで返す
+
+        Args:
+            v: 頂点
+
+        Returns:
+            targets の連続領域を指すビュー (イテレート・in 判定が可能)
+        """
+        return self._view[self.offsets[v]:self.offsets[v + 1]]
+
+    def degree(self, v: int) -> int:
+        """
+        頂点 v の出次数 (get_out_degree と同じ)
+
+        Args:
+            v: 頂点
+
+        Returns:
+            頂点 v の出次数
+        """
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        辺 (u, v) が存在するかチェック (has_edge と同じ)
+
+        Args:
+            u: 始点
+            v: 終点
+
+        Returns:
+            辺 (u, v) が存在するか
+
+        時間計算量: O(次数)
+        """
+        return v in self.neighbors(u)
+
+    def num_edges(self) -> int:
+        """格納している辺 (有向辺) の数"""
+        return len(self.targets)
+
+    def nbytes(self) -> int:
+        """offsets と targets が使用するバイト数"""
+        return (
+            len(self.offsets) * self.offsets.itemsize
+            + len(self.targets) * self.targets.itemsize
+        )
+
+    def __len__(self) -> int:
+        return self.N
+
+    def __getitem__(self, v: int) -> memoryview:
+        if not 0 <= v < self.N:
+            raise IndexError("vertex out of range")
+        return self.neighbors(v)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for v in range(self.N):
+            yield self.neighbors(v)
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(N={self.N}, M={len(self.targets)})"
+
+
+# 3. 重み付きグラフ (Weighted Graph)
 class Edge(NamedTuple):
     """
     重み付き辺を表すクラス
@@ -236,6 +442,223 @@ def has_edge(G: Graph, u: int, v: int) -> bool:
     return v in G[u]
 
 
+# 版番号を監視しているグラフの記録 (id(G) → [版番号, 監視している数])
+# add_edge / add_weighted_edge で辺を追加するたびに版番号が増えるので、
+# 計算結果をキャッシュする側は版番号の変化で古い結果を捨てられる。
+#
+# Graph / WeightedGraph は list なので弱参照 (weakref) を作れず、
+# グラフが捨てられたことを知る方法がない。そこで記録は監視中のグラフだけに持たせる:
+# - 監視する側は、監視している間 G への参照を持ち続ける
+#   (G は生きているので、その id が別のグラフに再利用されることはない)
+# - 監視が全て外れたら記録を消す (記録は監視中のグラフの数までしか増えない)
+_graph_versions: dict[int, list[int]] = {}
+
+
+def watch_graph_version(G) -> int:
+    """
+    グラフの版番号の監視を始める
+
+    監視している間は G への参照を持ち続け、不要になったら unwatch_graph_version を呼ぶこと。
+
+    Args:
+        G: グラフ (Graph / WeightedGraph)
+
+    Returns:
+        現在の版番号
+    """
+    record = _graph_versions.setdefault(id(G), [0, 0])
+    record[1] += 1
+    return record[0]
+
+
+def unwatch_graph_version(G) -> None:
+    """
+    グラフの版番号の監視をやめる (監視している数が 0 になったら記録を消す)
+
+    Args:
+        G: watch_graph_version で監視を始めたグラフ
+    """
+    record = _graph_versions[id(G)]
+    record[1] -= 1
+    if record[1] == 0:
+        del _graph_versions[id(G)]
+
+
+def graph_version(G) -> int:
+    """
+    グラフの版番号を取得する
+
+    Args:
+        G: グラフ (Graph / WeightedGraph)
+
+    Returns:
+        監視を始めてから add_edge / add_weighted_edge で辺を追加した回数
+        (監視されていなければ 0)
+    """
+    record = _graph_versions.get(id(G))
+    return record[0] if record is not None else 0
+
+
+def bump_graph_version(G) -> None:
+    """
+    グラフの版番号を 1 増やす (監視されていなければ何もしない)
+
+    add_edge / add_weighted_edge 以外の方法でグラフを書き換えたときに呼ぶ
+    """
+    record = _graph_versions.get(id(G))
+    if record is not None:
+        record[0] += 1
+
+
+def add_edge(G: Graph, u: int, v: int, directed: bool = True) -> None:
+    """
+    グラフに辺 (u, v) を追加し、版番号を更新する
+
+    Args:
+        G: グラフの隣接リスト
+        u: 始点
+        v: 終点
+        directed: 有向グラフかどうか (デフォルト: True)
+    """
+    G[u].append(v)
+
+    # 無向グラフの場合は逆辺も追加
+    if not directed:
+        G[v].append(u)
+
+    bump_graph_version(G)
+
+
+def reverse_graph(G: Graph) -> Graph:
+    """
+    全ての辺の向きを反転したグラフ (逆隣接リスト) を作る
+
+    Args:
+        G: グラフの隣接リスト
+
+    Returns:
+        RG[v] = 頂点 v に入ってくる辺の始点のリスト
+
+    時間計算量: O(N + M)
+    """
+    RG: Graph = [[] for _ in range(len(G))]
+    for u, neighbors in enumerate(G):
+        for v in neighbors:
+            RG[v].append(u)
+    return RG
+
+
+class DegreeIndex:
+    """
+    入次数・出次数と逆隣接リストを保持するインデックス
+
+    get_in_degree は全頂点の隣接リストを走査するため 1 回 O(N + M) かかり、
+    全頂点の入次数を求めると O(N * M) になる。
+    構築時に 1 回だけ全辺を走査しておけば、入次数は O(1)、
+    入ってくる辺の列挙は O(入次数) で求まる。
+
+    辺の追加は add_edge を通して行うことで、G とインデックスが常に一致する。
+    多重辺は本数分だけ数える (get_in_degree は始点ごとに 1 回しか数えない)。
+
+    Attributes:
+        G: 元のグラフの隣接リスト (add_edge で更新される)
+        rev: 逆隣接リスト (rev[v] = v に入ってくる辺の始点)
+        in_deg: 各頂点の入次数
+        out_deg: 各頂点の出次数
+    """
+
+    def __init__(self, G: Graph) -> None:
+        """
+        インデックスを構築する
+
+        Args:
+            G: グラフの隣接リスト (有向グラフ)
+
+        時間計算量: O(N + M)
+        """
+        self.G = G
+        self.rev = reverse_graph(G)
+        self.in_deg = [len(preds) for preds in self.rev]
+        self.out_deg = [len(neighbors) for neighbors in G]
+
+    def add_edge(self, u: int, v: int) -> None:
+        """
+        辺 (u, v) を追加し、インデックスも更新する
+
+        Args:
+            u: 始点
+            v: 終点
+
+        時間計算量: O(1)
+        """
+        add_edge(self.G, u, v)
+        self.rev[v].append(u)
+        self.out_deg[u] += 1
+        self.in_deg[v] += 1
+
+    def in_degree(self, v: int) -> int:
+        """
+        頂点 v の入次数 (get_in_degree と同じ)
+
+        時間計算量: O(1)
+        """
+        return self.in_deg[v]
+
+    def out_degree(self, v: int) -> int:
+        """
+        頂点 v の出次数 (get_out_degree と同じ)
+
+        時間計算量: O(1)
+        """
+        return self.out_deg[v]
+
+    def predecessors(self, v: int) -> list[int]:
+        """
+        頂点 v に入ってくる辺の始点のリスト
+
+        時間計算量: O(1) (列挙は O(入次数))
+        """
+        return self.rev[v]
+
+
+class EdgeIndex:
+    """
+    辺の存在確認を O(1) で行うためのハッシュインデックス
+
+    has_edge は G[u] を線形探索するため O(次数) かかり、
+    次数の大きいハブ頂点では遅くなる。
+    辺 (u, v) を整数 u * N + v に符号化して集合に入れておけば、
+    存在確認は平均 O(1) になる (タプルを作らない分メモリも少ない)。
+
+    構築後に G を変更した場合はインデックスを作り直す必要がある。
+    符号化が 1 対 1 になるのは 0 <= v < N のときだけなので、範囲外の v は先に弾く。
+
+    Attributes:
+        N: 頂点数
+        keys: 辺 (u, v) を u * N + v に符号化した集合
+    """
+
+    def __init__(self, G: Graph) -> None:
+        """
+        インデックスを構築する
+
+        Args:
+            G: グラフの隣接リスト
+
+        時間計算量: O(N + M)
+        """
+        self.N = N = len(G)
+        self.keys = {u * N + v for u, neighbors in enumerate(G) for v in neighbors}
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        辺 (u, v) が存在するかチェック (has_edge と同じ)
+
+        時間計算量: 平均 O(1)
+        """
+        return 0 <= v < self.N and u * self.N + v in self.keys
+
+
 # ===== 重み付きグラフ用の関数 =====
 
 
@@ -360,6 +783,849 @@ def has_weighted_edge(G: WeightedGraph, u: int, v: int) -> Optional[int]:
     return None
 
 
+def add_weighted_edge(
+    G: WeightedGraph, u: int, v: int, w: int, directed: bool = True
+) -> None:
+    """
+    重み付きグラフに辺 (u, v) を追加し、版番号を更新する
+
+    Args:
+        G: 重み付きグラフの隣接リスト
+        u: 始点
+        v: 終点
+        w: 重み
+        directed: 有向グラフかどうか (デフォルト: True)
+    """
+    G[u].append(Edge(to=v, weight=w))
+
+    # 無向グラフの場合は逆辺も追加
+    if not directed:
+        G[v].append(Edge(to=u, weight=w))
+
+    bump_graph_version(G)
+
+
+class WeightedEdgeIndex:
+    """
+    重み付き辺の存在確認と重み取得を O(1) で行うためのハッシュインデックス
+
+    has_weighted_edge は G[u] を線形探索するため O(次数) かかる。
+    u * N + v → 重み の辞書を持っておけば平均 O(1) で答えられる。
+
+    多重辺がある場合は has_weighted_edge と同じく G[u] で最初に現れる辺の重みを返す。
+    構築後に G を変更した場合はインデックスを作り直す必要がある。
+    EdgeIndex と同じく、範囲外の v は符号化する前に弾く。
+
+    Attributes:
+        N: 頂点数
+        weights: u * N + v → 辺 (u, v) の重み
+    """
+
+    def __init__(self, G: WeightedGraph) -> None:
+        """
+        インデックスを構築する
+
+        Args:
+            G: 重み付きグラフの隣接リスト
+
+        時間計算量: O(N + M)
+        """
+        self.N = N = len(G)
+        self.weights: dict[int, int] = {}
+        for u, edges in enumerate(G):
+            for edge in edges:
+                # 最初に現れた辺を優先する
+                self.weights.setdefault(u * N + edge.to, edge.weight)
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        辺 (u, v) が存在するかチェック
+
+        時間計算量: 平均 O(1)
+        """
+        return 0 <= v < self.N and u * self.N + v in self.weights
+
+    def get_weight(self, u: int, v: int) -> Optional[int]:
+        """
+        辺 (u, v) の重みを返す (has_weighted_edge と同じ)
+
+        Returns:
+            辺が存在する場合はその重み、存在しない場合は None
+
+        時間計算量: 平均 O(1)
+        """
+        if not 0 <= v < self.N:
+            return None
+        return self.weights.get(u * self.N + v)
+
+
+class CSRWeightedGraph:
+    """
+    終点と重みを平行な型付き配列で持つ重み付きグラフ (CSR 形式, Struct of Arrays)
+
+    WeightedGraph は辺ごとに Edge (NamedTuple) を確保するため、
+    辺 1 本あたり 64 バイト以上を消費する。
+    ここでは終点 (int32) と重み (int64 または float64) を別々の配列に並べるので、
+    辺 1 本あたり 12 バイトで済む。Edge は G[v] でアクセスされたときにだけ作る。
+
+    重みが 1 本の配列に連続して並ぶため、最小値・合計・定数倍などの一括処理は
+    配列全体に対する 1 回の操作になる (array はバッファプロトコルに対応しているので
+    numpy.frombuffer でコピーなしに参照することもできる)。
+
+    Attributes:
+        N: 頂点数
+        offsets: 長さ N + 1 のオフセット配列 (int64)
+        targets: 長さ M の終点配列 (int32)
+        weights: 長さ M の重み配列 (int64 "q" または float64 "d")
+    """
+
+    def __init__(self, N: int, offsets, targets, weights) -> None:
+        """
+        CSR 形式の重み付きグラフを初期化する
+
+        Args:
+            N: 頂点数
+            offsets: 長さ N + 1 のオフセット配列
+            targets: 長さ offsets[N] の終点配列
+            weights: targets と同じ長さの重み配列
+
+        通常は from_edges / from_weighted_graph から構築する
+        """
+        if (
+            len(offsets) != N + 1
+            or offsets[N] != len(targets)
+            or len(targets) != len(weights)
+        ):
+            raise ValueError("Invalid CSR arrays: offsets, targets and weights do not match")
+
+        self.N = N
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        # 辺をコピーなしで切り出すためのビュー
+        self._targets_view = memoryview(targets)
+        self._weights_view = memoryview(weights)
+
+    @classmethod
+    def from_edges(
+        cls,
+        N: int,
+        edges: list[tuple[int, int, int]],
+        directed: bool = True,
+        weight_typecode: str = "q",
+    ) -> "CSRWeightedGraph":
+        """
+        辺のリストから構築する (計数ソート)
+
+        辺の順序は read_weighted_graph_from_list と同じになる
+
+        Args:
+            N: 頂点数
+            edges: 辺のリスト [(a, b, w), ...]
+            directed: 有向グラフかどうか (デフォルト: True)
+            weight_typecode: 重みの型 ("q" = int64, "d" = float64)
+
+        Returns:
+            CSR 形式の重み付きグラフ
+
+        Raises:
+            ValueError: 未対応の型コードの場合
+
+        時間計算量: O(N + M)
+        """
+        if weight_typecode not in ("q", "d"):
+            raise ValueError(f"Unsupported weight typecode: {weight_typecode}")
+
+        # 出次数を数えて累積和をとる
+        offsets = array("q", bytes(8 * (N + 1)))
+        for a, b, _ in edges:
+            offsets[a + 1] += 1
+            if not directed:
+                offsets[b + 1] += 1
+        for v in range(N):
+            offsets[v + 1] += offsets[v]
+
+        M = offsets[N]
+        pos = offsets[:-1]
+        targets = array("i", bytes(4 * M))
+        weights = array(weight_typecode, bytes(8 * M))
+        for a, b, w in edges:
+            targets[pos[a]] = b
+            weights[pos[a]] = w
+            pos[a] += 1
+
+            # 無向グラフの場合は逆辺も追加
+            if not directed:
+                targets[pos[b]] = a
+                weights[pos[b]] = w
+                pos[b] += 1
+
+        return cls(N, offsets, targets, weights)
+
+    @classmethod
+    def from_weighted_graph(
+        cls, G: WeightedGraph, weight_typecode: str = "q"
+    ) -> "CSRWeightedGraph":
+        """
+        重み付き隣接リストから変換する
+
+        Args:
+            G: 重み付きグラフの隣接リスト
+            weight_typecode: 重みの型 ("q" = int64, "d" = float64)
+
+        Returns:
+            同じ辺 (同じ順序) を持つ CSR 形式の重み付きグラフ
+
+        Raises:
+            ValueError: 未対応の型コードの場合
+
+        時間計算量: O(N + M)
+        """
+        if weight_typecode not in ("q", "d"):
+            raise ValueError(f"Unsupported weight typecode: {weight_typecode}")
+
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array(weight_typecode)
+        for edges in G:
+            for edge in edges:
+                targets.append(edge.to)
+                weights.append(edge.weight)
+            offsets.append(len(targets))
+
+        return cls(len(G), offsets, targets, weights)
+
+    def to_weighted_graph(self) -> WeightedGraph:
+        """
+        重み付き隣接リストに戻す
+
+        Returns:
+            重み付きグラフの隣接リスト
+        """
+        return [self[v] for v in range(self.N)]
+
+    def neighbors(self, v: int) -> tuple[memoryview, memoryview]:
+        """
+        頂点 v から出ている辺の (終点, 重み) をコピーなしで返す
+
+        Returns:
+            タプル (targets, weights) (同じ長さのビュー)
+        """
+        lo, hi = self.offsets[v], self.offsets[v + 1]
+        return self._targets_view[lo:hi], self._weights_view[lo:hi]
+
+    def degree(self, v: int) -> int:
+        """頂点 v の出次数"""
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def get_weight(self, u: int, v: int) -> Optional[int]:
+        """
+        辺 (u, v) の重みを返す (has_weighted_edge と同じ)
+
+        Returns:
+            辺が存在する場合はその重み、存在しない場合は None
+
+        時間計算量: O(次数)
+        """
+        targets, weights = self.neighbors(u)
+        for to, w in zip(targets, weights):
+            if to == v:
+                return w
+        return None
+
+    def num_edges(self) -> int:
+        """格納している辺 (有向辺) の数"""
+        return len(self.targets)
+
+    def min_weight(self) -> Optional[int]:
+        """全ての辺の重みの最小値 (辺がなければ None)"""
+        return min(self.weights, default=None)
+
+    def total_weight(self) -> int:
+        """全ての辺の重みの合計"""
+        return sum(self.weights)
+
+    def scale_weights(self, factor: int) -> None:
+        """
+        全ての辺の重みを factor 倍する (その場で更新)
+
+        Args:
+            factor: 倍率 (重みが int64 の場合は整数)
+
+        Raises:
+            TypeError: 読み取り専用のグラフの場合、または型に合わない倍率の場合
+
+        要素ごとに Python で代入するのではなく、倍率を掛けた配列を map で 1 回で作り、
+        ビューへのスライス代入 (C の memcpy) でまとめて書き戻す。
+        """
+        weights = self._weights_view
+        if weights.readonly:
+            raise TypeError("Cannot scale weights of a read-only graph")
+        weights[:] = array(weights.format, map(mul, weights, repeat(factor)))
+
+    def nbytes(self) -> int:
+        """offsets, targets, weights が使用するバイト数"""
+        return sum(
+            len(a) * a.itemsize for a in (self.offsets, self.targets, self.weights)
+        )
+
+    def __len__(self) -> int:
+        return self.N
+
+    def __getitem__(self, v: int) -> list[Edge]:
+        if not 0 <= v < self.N:
+            raise IndexError("vertex out of range")
+        targets, weights = self.neighbors(v)
+        return [Edge(to, w) for to, w in zip(targets, weights)]
+
+    def __iter__(self) -> Iterator[list[Edge]]:
+        for v in range(self.N):
+            yield self[v]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(N={self.N}, M={len(self.targets)})"
+
+
+# ===== バイナリ形式での保存・読み込み (mmap) =====
+
+# ファイル形式 (数値はすべてネイティブのバイトオーダー):
+#   ヘッダ (32 バイト): マジック 8 バイト, N (int64), M (int64), 重みの型コード 1 バイト + 詰め物
+#   offsets: (N + 1) 個の int64
+#   targets: M 個の int32 (8 バイト境界まで 0 埋め)
+#   weights: M 個の int64 ("q") または float64 ("d")
+GRAPH_FILE_MAGIC = b"WGRAPH01"
+_GRAPH_FILE_HEADER = struct.Struct("=8sqq1s7x")
+
+
+def save_weighted_graph(G: WeightedGraph, path: str, weight_typecode: str = "q") -> None:
+    """
+    重み付きグラフを CSR 形式のバイナリファイルに保存する
+
+    Args:
+        G: 重み付きグラフの隣接リスト (CSRWeightedGraph ならその型のまま書き出す)
+        path: 保存先のパス
+        weight_typecode: 重みの型 ("q" = int64, "d" = float64)
+
+    Raises:
+        ValueError: 未対応の型コードの場合 (from_weighted_graph で検出する)
+
+    時間計算量: O(N + M)
+    """
+    if isinstance(G, CSRWeightedGraph):
+        # すでに CSR 形式なら配列をそのまま書き出す (array は typecode, memoryview は format)
+        csr = G
+        weight_typecode = getattr(G.weights, "typecode", None) or G.weights.format
+    else:
+        csr = CSRWeightedGraph.from_weighted_graph(G, weight_typecode)
+    N, M = csr.N, csr.num_edges()
+
+    with open(path, "wb") as f:
+        f.write(_GRAPH_FILE_HEADER.pack(GRAPH_FILE_MAGIC, N, M, weight_typecode.encode()))
+        f.write(csr.offsets)
+        f.write(csr.targets)
+        # weights を 8 バイト境界に揃える
+        f.write(bytes(-(M * 4) % 8))
+        f.write(csr.weights)
+
+
+class MappedWeightedGraph(CSRWeightedGraph):
+    """
+    mmap で読み込んだ読み取り専用の重み付きグラフ
+
+    ファイルの内容をコピーせずに配列として参照するため、読み込みはほぼ一瞬で、
+    同じファイルを開いた複数のプロセスは物理メモリのページを共有する。
+
+    CSRWeightedGraph と同じ操作ができ、G[v] は Edge のリストを返すので
+    WeightedGraph を受け取る関数 (visualize_weighted_graph, has_weighted_edge など)
+    にそのまま渡せる。配列は読み取り専用のビューなので scale_weights は使えない。
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        ファイルを mmap して開く
+
+        Args:
+            path: save_weighted_graph で保存したファイルのパス
+
+        Raises:
+            ValueError: ファイル形式が不正な場合
+
+        時間計算量: O(1) (データはアクセス時にページ単位で読み込まれる)
+        """
+        with open(path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # 空のファイルは mmap できない
+                raise ValueError(f"Not a weighted graph file (empty): {path}") from None
+        self._mm = mm
+
+        buf = memoryview(mm)
+        views: list[memoryview] = []
+        try:
+            if len(buf) < _GRAPH_FILE_HEADER.size:
+                raise ValueError(f"Not a weighted graph file (too short): {path}")
+            magic, N, M, typecode = _GRAPH_FILE_HEADER.unpack_from(buf)
+            if magic != GRAPH_FILE_MAGIC:
+                raise ValueError(f"Not a weighted graph file: {path}")
+            if typecode not in (b"q", b"d"):
+                raise ValueError(f"Unsupported weight typecode {typecode!r}: {path}")
+            if N < 0 or M < 0:
+                raise ValueError(f"Invalid header (N = {N}, M = {M}): {path}")
+
+            # ヘッダから決まるファイルサイズと実際のサイズを比べる (途中で切れたファイルを弾く)
+            pad = (-4 * M) % 8
+            expected = _GRAPH_FILE_HEADER.size + 8 * (N + 1) + 4 * M + pad + 8 * M
+            if len(buf) != expected:
+                raise ValueError(
+                    f"File size mismatch: expected {expected} bytes, got {len(buf)}: {path}"
+                )
+
+            pos = _GRAPH_FILE_HEADER.size
+            offsets = buf[pos : pos + 8 * (N + 1)].cast("q")
+            views.append(offsets)
+            pos += 8 * (N + 1)
+            targets = buf[pos : pos + 4 * M].cast("i")
+            views.append(targets)
+            pos += 4 * M + pad
+            weights = buf[pos : pos + 8 * M].cast(typecode.decode())
+            views.append(weights)
+            self._buf = buf
+
+            super().__init__(N, offsets, targets, weights)
+        except Exception:
+            # どこで失敗しても、作ったビューを解放してから mmap を閉じる
+            for view in views:
+                view.release()
+            buf.release()
+            mm.close()
+            self._buf = None
+            self._mm = None
+            raise
+
+    def close(self) -> None:
+        """
+        mmap を閉じる (以降はこのグラフからアクセスできない)
+
+        このオブジェクトが持っているビューを解放してから、最後に mmap を閉じる。
+        呼び出し側が neighbors(v) などで得たビューをまだ持っている場合は mmap を閉じられないので、
+        マッピングはそのビューが全て解放されるまで残り (ビューは引き続き読める)、
+        最後のビューと一緒に解放される。2 回以上呼んでもよい。
+        """
+        if self._buf is None:
+            return
+
+        for view in (
+            self._targets_view,
+            self._weights_view,
+            self.offsets,
+            self.targets,
+            self.weights,
+            self._buf,
+        ):
+            view.release()
+        self._buf = None
+
+        try:
+            self._mm.close()
+        except BufferError:
+            # 外部のビューが残っている: self._mm の参照を手放し、最後のビューに解放を任せる
+            pass
+        self._mm = None
+
+    def __enter__(self) -> "MappedWeightedGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_weighted_graph(path: str) -> MappedWeightedGraph:
+    """
+    save_weighted_graph で保存したファイルを mmap で読み込む
+
+    Args:
+        path: ファイルのパス
+
+    Returns:
+        読み取り専用の重み付きグラフ
+    """
+    return MappedWeightedGraph(path)
+
+
+# ===== 一括読み込み (大規模入力用) =====
+
+
+class LoadStats(NamedTuple):
+    """
+    一括読み込みの計測結果
+
+    Attributes:
+        bytes_read: 読み込んだバイト数
+        num_ints: パースした整数の個数
+        seconds: 読み込み + パースにかかった秒数
+    """
+    bytes_read: int
+    num_ints: int
+    seconds: float
+
+    @property
+    def ints_per_sec(self) -> float:
+        """1 秒あたりにパースした整数の個数"""
+        return self.num_ints / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def mb_per_sec(self) -> float:
+        """1 秒あたりに処理したメガバイト数"""
+        return self.bytes_read / 1e6 / self.seconds if self.seconds > 0 else float("inf")
+
+
+def read_ints_bulk(path: Optional[str] = None) -> tuple[array, LoadStats]:
+    """
+    入力全体を 1 回で読み込み、空白区切りの整数をまとめてパースする
+
+    input().split() を行ごとに呼ぶ代わりに、バイト列を一度だけ読んで
+    bytes.split() と map(int, ...) で一括変換する。
+
+    Args:
+        path: 読み込むファイルのパス (省略時は標準入力)
+
+    Returns:
+        タプル (ints, stats)
+        - ints: 入力に現れた整数を順に並べた int64 配列
+        - stats: 計測結果
+
+    時間計算量: O(入力サイズ)
+    """
+    start = time.perf_counter()
+
+    if path is None:
+        data = sys.stdin.buffer.read()
+    else:
+        with open(path, "rb") as f:
+            data = f.read()
+
+    ints = array("q", map(int, data.split()))
+    stats = LoadStats(len(data), len(ints), time.perf_counter() - start)
+
+    return ints, stats
+
+
+def read_edge_array_bulk(
+    path: Optional[str] = None, weighted: bool = False
+) -> tuple[int, int, array, LoadStats]:
+    """
+    read_graph_from_input と同じ形式の入力を読み込み、辺を平坦な配列で返す
+
+    Args:
+        path: 読み込むファイルのパス (省略時は標準入力)
+        weighted: 各辺に重みがあるか (a b w 形式)
+
+    Returns:
+        タプル (N, M, edges, stats)
+        - edges: [a1, b1, a2, b2, ...] (重み付きなら [a1, b1, w1, ...])
+        - stats: 計測結果
+
+    Raises:
+        ValueError: 先頭の N M がない場合、または辺の数が M に足りない場合
+    """
+    ints, stats = read_ints_bulk(path)
+    if len(ints) < 2:
+        raise ValueError("Expected 'N M' header, but input is too short")
+    N, M = ints[0], ints[1]
+
+    width = 3 if weighted else 2
+    if len(ints) < 2 + width * M:
+        raise ValueError(f"Expected {M} edges, but input is too short")
+
+    return N, M, ints[2 : 2 + width * M], stats
+
+
+def read_graph_bulk(
+    path: Optional[str] = None, directed: bool = True
+) -> tuple[int, int, Graph, LoadStats]:
+    """
+    read_graph_from_input の一括読み込み版
+
+    Args:
+        path: 読み込むファイルのパス (省略時は標準入力)
+        directed: 有向グラフかどうか (デフォルト: True)
+
+    Returns:
+        タプル (N, M, G, stats)
+        - G: read_graph_from_input と同じ隣接リスト
+        - stats: 計測結果
+    """
+    N, M, flat, stats = read_edge_array_bulk(path)
+
+    G: Graph = [[] for _ in range(N)]
+    for a, b in zip(flat[0::2], flat[1::2]):
+        G[a].append(b)
+
+        # 無向グラフの場合は逆辺も追加
+        if not directed:
+            G[b].append(a)
+
+    return N, M, G, stats
+
+
+def read_weighted_graph_bulk(
+    path: Optional[str] = None, directed: bool = True
+) -> tuple[int, int, WeightedGraph, LoadStats]:
+    """
+    read_weighted_graph_from_input の一括読み込み版
+
+    Args:
+        path: 読み込むファイルのパス (省略時は標準入力)
+        directed: 有向グラフかどうか (デフォルト: True)
+
+    Returns:
+        タプル (N, M, G, stats)
+        - G: read_weighted_graph_from_input と同じ重み付き隣接リスト
+        - stats: 計測結果
+    """
+    N, M, flat, stats = read_edge_array_bulk(path, weighted=True)
+
+    G: WeightedGraph = [[] for _ in range(N)]
+    for a, b, w in zip(flat[0::3], flat[1::3], flat[2::3]):
+        G[a].append(Edge(to=b, weight=w))
+
+        # 無向グラフの場合は逆辺も追加
+        if not directed:
+            G[b].append(Edge(to=a, weight=w))
+
+    return N, M, G, stats
+
+
+# ===== 分割読み込み (ストリーミング) =====
+
+
+class IngestStats:
+    """
+    分割読み込みの計測結果
+
+    読み込み関数に渡すと、処理した辺の数と時間が書き込まれる。
+    trace_memory=True の場合は tracemalloc で Python ヒープの最大使用量も計測する
+    (計測中は処理が遅くなる)。
+
+    Attributes:
+        edges: 処理した辺の数
+        seconds: 処理にかかった秒数
+        peak_bytes: 処理中に確保されたメモリの最大値 (trace_memory=False なら None)
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.edges = 0
+        self.seconds = 0.0
+        self.peak_bytes: Optional[int] = None
+        self._start = 0.0
+        self._started_tracing = False
+
+    @property
+    def edges_per_sec(self) -> float:
+        """1 秒あたりに処理した辺の数"""
+        return self.edges / self.seconds if self.seconds > 0 else float("inf")
+
+    def start(self) -> None:
+        """計測を開始する"""
+        if self.trace_memory:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    def stop(self) -> None:
+        """計測を終了する"""
+        self.seconds += time.perf_counter() - self._start
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_bytes = max(self.peak_bytes or 0, peak)
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestStats(edges={self.edges}, seconds={self.seconds:.3f}, "
+            f"peak_bytes={self.peak_bytes})"
+        )
+
+
+def iter_edge_chunks(
+    edges: Iterable[tuple[int, int]], chunk_size: int = 1 << 16
+) -> Iterator[array]:
+    """
+    任意のイテラブル (ジェネレータなど) の辺を chunk_size 本ずつまとめる
+
+    Args:
+        edges: 辺のイテラブル [(a, b), ...]
+        chunk_size: 1 チャンクあたりの辺の数
+
+    Yields:
+        平坦な int64 配列 [a1, b1, a2, b2, ...] (最大 chunk_size 本分)
+    """
+    it = iter(edges)
+    while True:
+        chunk = array("q")
+        for a, b in islice(it, chunk_size):
+            chunk.append(a)
+            chunk.append(b)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_edge_file_chunks(f: BinaryIO, chunk_size: int = 1 << 16) -> Iterator[array]:
+    """
+    ファイルから 1 行 1 辺 ("a b") を chunk_size 行ずつ読み込む
+
+    Args:
+        f: バイナリモードで開いたファイル (ヘッダ行は読み飛ばしておく)
+        chunk_size: 1 チャンクあたりの行数
+
+    Yields:
+        平坦な int64 配列 [a1, b1, a2, b2, ...]
+
+    Raises:
+        ValueError: 辺の端点が揃っていない場合
+    """
+    while True:
+        lines = list(islice(f, chunk_size))
+        if not lines:
+            return
+        chunk = array("q", map(int, b"".join(lines).split()))
+        if len(chunk) % 2:
+            raise ValueError("Malformed edge list: odd number of endpoints")
+        yield chunk
+
+
+def stream_graph(
+    N: int,
+    chunks: Iterable[array],
+    directed: bool = True,
+    stats: Optional[IngestStats] = None,
+) -> Graph:
+    """
+    辺のチャンクを順に消費して隣接リストを構築する
+
+    辺全体のリストを作らないので、ピーク時に保持するのは隣接リストと
+    1 チャンク分の配列だけになる。
+
+    Args:
+        N: 頂点数
+        chunks: iter_edge_chunks / iter_edge_file_chunks が返すチャンク
+        directed: 有向グラフかどうか (デフォルト: True)
+        stats: 計測結果の書き込み先 (省略可)
+
+    Returns:
+        read_graph_from_list と同じ隣接リスト
+    """
+    if stats is not None:
+        stats.start()
+
+    G: Graph = [[] for _ in range(N)]
+    for chunk in chunks:
+        for a, b in zip(chunk[0::2], chunk[1::2]):
+            G[a].append(b)
+
+            # 無向グラフの場合は逆辺も追加
+            if not directed:
+                G[b].append(a)
+
+        if stats is not None:
+            stats.edges += len(chunk) // 2
+
+    if stats is not None:
+        stats.stop()
+
+    return G
+
+
+def stream_graph_from_file(
+    path: str,
+    directed: bool = True,
+    chunk_size: int = 1 << 16,
+    stats: Optional[IngestStats] = None,
+) -> tuple[int, int, Graph]:
+    """
+    read_graph_from_input と同じ形式のファイルを分割して読み込む
+
+    Args:
+        path: ファイルのパス
+        directed: 有向グラフかどうか (デフォルト: True)
+        chunk_size: 1 チャンクあたりの行数
+        stats: 計測結果の書き込み先 (省略可)
+
+    Returns:
+        タプル (N, M, G)
+    """
+    with open(path, "rb") as f:
+        N, M = map(int, f.readline().split())
+        G = stream_graph(N, iter_edge_file_chunks(f, chunk_size), directed, stats)
+
+    return N, M, G
+
+
+def stream_csr_graph_from_file(
+    path: str,
+    directed: bool = True,
+    chunk_size: int = 1 << 16,
+    stats: Optional[IngestStats] = None,
+) -> CSRGraph:
+    """
+    ファイルを 2 回分割して読み込み、CSR グラフを構築する
+
+    1 回目で各頂点の出次数だけを数えて offsets を確定し、
+    2 回目で targets に終点を書き込む。隣接リストも辺のリストも作らないので、
+    ピーク時のメモリは CSR の配列 + 1 チャンク分で済む。
+
+    Args:
+        path: read_graph_from_input と同じ形式のファイルのパス
+        directed: 有向グラフかどうか (デフォルト: True)
+        chunk_size: 1 チャンクあたりの行数
+        stats: 計測結果の書き込み先 (省略可、辺の数は 1 回分だけ数える)
+
+    Returns:
+        CSRGraph.from_edges と同じ CSR グラフ
+    """
+    if stats is not None:
+        stats.start()
+
+    # 1 回目: 出次数を数える
+    with open(path, "rb") as f:
+        N, _ = map(int, f.readline().split())
+        offsets = array(CSRGraph.OFFSET_TYPECODE, bytes(8 * (N + 1)))
+        for chunk in iter_edge_file_chunks(f, chunk_size):
+            for a, b in zip(chunk[0::2], chunk[1::2]):
+                offsets[a + 1] += 1
+                if not directed:
+                    offsets[b + 1] += 1
+            if stats is not None:
+                stats.edges += len(chunk) // 2
+
+    for v in range(N):
+        offsets[v + 1] += offsets[v]
+
+    # 2 回目: 終点を書き込む
+    pos = offsets[:-1]
+    targets = array(CSRGraph.TARGET_TYPECODE, bytes(4 * offsets[N]))
+    with open(path, "rb") as f:
+        f.readline()
+        for chunk in iter_edge_file_chunks(f, chunk_size):
+            for a, b in zip(chunk[0::2], chunk[1::2]):
+                targets[pos[a]] = b
+                pos[a] += 1
+                if not directed:
+                    targets[pos[b]] = a
+                    pos[b] += 1
+
+    if stats is not None:
+        stats.stop()
+
+    return CSRGraph(N, offsets, targets)
+
+
 def main() -> None:
     """使用例とテストケース"""
     print("=== グラフの入力と構築 ===\n")
@@ -392,21 +1658,40 @@ def main() -> None:
     print()
 
     # 各頂点の次数を表示
+    # 入次数は DegreeIndex で一括計算する (get_in_degree を全頂点で呼ぶと O(N * M))
     print("=== 各頂点の出次数 ===")
+    index = DegreeIndex(G)
     for v in range(N):
-        out_deg = get_out_degree(G, v)
-        in_deg = get_in_degree(G, v)
+        out_deg = index.out_degree(v)
+        in_deg = index.in_degree(v)
+        assert in_deg == get_in_degree(G, v)
         print(f"  頂点 {v}: 出次数 = {out_deg}, 入次数 = {in_deg}")
+    print(f"  頂点 7 に入ってくる辺の始点: {index.predecessors(7)}")
     print()
 
     # 辺の存在確認
     print("=== 辺の存在確認 ===")
     test_edges = [(4, 1), (4, 3), (0, 5), (5, 0)]
+    edge_index = EdgeIndex(G)
     for u, v in test_edges:
         exists = has_edge(G, u, v)
+        assert edge_index.has_edge(u, v) == exists
         print(f"  辺 ({u}, {v}): {'存在する' if exists else '存在しない'}")
     print()
 
+    # CSR 形式の例
+    print("=== CSR 形式のグラフ ===")
+    G_csr = CSRGraph.from_edges(N, edges_example, directed=True)
+    print(f"  {G_csr}")
+    print(f"  offsets = {G_csr.offsets.tolist()}")
+    print(f"  targets = {G_csr.targets.tolist()}")
+    print(f"  隣接リストと一致: {G_csr.to_graph() == G}")
+    print(f"  CSRGraph.from_graph(G) と一致: {CSRGraph.from_graph(G).to_graph() == G}")
+    for u, v in test_edges:
+        assert G_csr.has_edge(u, v) == has_edge(G, u, v)
+    print(f"  使用メモリ: {G_csr.nbytes()} バイト")
+    print()
+
     # 無向グラフの例
     print("=== 無向グラフの例 ===")
     edges_undirected = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)]
@@ -445,8 +1730,10 @@ def main() -> None:
     # 重み付き辺の存在確認
     print("=== 重み付き辺の存在確認 ===")
     test_weighted_edges = [(0, 1), (0, 3), (1, 3), (2, 3)]
+    weighted_index = WeightedEdgeIndex(G_weighted)
     for u, v in test_weighted_edges:
         weight = has_weighted_edge(G_weighted, u, v)
+        assert weighted_index.get_weight(u, v) == weight
         if weight is not None:
             print(f"  辺 ({u}, {v}): 存在する（重み = {weight}）")
         else:
@@ -469,6 +1756,59 @@ def main() -> None:
     print(f"辺数: {len(undirected_weighted_edges)}")
     print()
     print(visualize_weighted_graph(G_undirected_weighted))
+    print()
+
+    # Struct of Arrays 形式の例
+    print("=== CSR 形式の重み付きグラフ ===")
+    G_soa = CSRWeightedGraph.from_edges(4, undirected_weighted_edges, directed=False)
+    print(f"  {G_soa} ({G_soa.nbytes()} バイト)")
+    print(f"  隣接リストと一致: {G_soa.to_weighted_graph() == G_undirected_weighted}")
+    print(f"  重みの最小値 = {G_soa.min_weight()}, 合計 = {G_soa.total_weight()}")
+    G_soa.scale_weights(10)
+    print(f"  10 倍した後の頂点 0 の辺: {G_soa[0]}")
+    print()
+
+    # バイナリ形式での保存と mmap 読み込みの例
+    print("=== バイナリ形式での保存と mmap 読み込み ===")
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "graph.bin")
+        save_weighted_graph(G_undirected_weighted, path)
+        with load_weighted_graph(path) as G_mapped:
+            print(f"  {G_mapped} ({os.path.getsize(path)} バイト)")
+            print(f"  元のグラフと一致: {list(G_mapped) == G_undirected_weighted}")
+            print(f"  辺 (3, 0) の重み: {has_weighted_edge(G_mapped, 3, 0)}")
+    print()
+
+    # 一括読み込みの例
+    print("=== 一括読み込み ===")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(f"{N} {M}\n")
+        f.writelines(f"{a} {b}\n" for a, b in edges_example)
+        path = f.name
+    try:
+        _, _, G_bulk, stats = read_graph_bulk(path)
+        G_csr_stream = stream_csr_graph_from_file(path, chunk_size=4)
+    finally:
+        os.remove(path)
+
+    print(f"  read_graph_from_list と一致: {G_bulk == G}")
+    print(
+        f"  {stats.bytes_read} バイト, {stats.num_ints} 個の整数, "
+        f"{stats.ints_per_sec:,.0f} ints/s"
+    )
+    print()
+
+    # 分割読み込みの例 (辺のリストを作らずにジェネレータから構築する)
+    print("=== 分割読み込み ===")
+    ingest = IngestStats(trace_memory=True)
+    edge_gen = ((a, b) for a, b in edges_example)
+    G_stream = stream_graph(N, iter_edge_chunks(edge_gen, chunk_size=4), stats=ingest)
+    print(f"  read_graph_from_list と一致: {G_stream == G}")
+    print(f"  ファイルから 2 パスで構築した CSR と一致: {G_csr_stream.to_graph() == G}")
+    print(f"  {ingest}, {ingest.edges_per_sec:,.0f} edges/s")
 
 
 if __name__ == "__main__":
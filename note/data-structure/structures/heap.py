@@ -128,6 +128,130 @@ class MinHeap:
         return len(self.heap) == 0
 
 
+class IndexedMinHeap:
+    """
+    添字付き最小ヒープ (decrease-key 対応)
+
+    要素は 0 から n-1 の整数 (頂点番号など) で、それぞれがキー (優先度) を持つ。
+    各要素がヒープ配列のどこにあるかを pos に記録しておくことで、
+    既にヒープにある要素のキーを O(log n) で減らせる。
+    同じ要素を重複して push しないので、ヒープのサイズは常に n 以下に収まる。
+
+    Attributes:
+        heap: 要素を並べたヒープ配列
+        key: 各要素のキー
+        pos: 各要素のヒープ配列上の位置 (ヒープにない場合は -1)
+    """
+
+    def __init__(self, n):
+        self.heap = []
+        self.key = [0] * n
+        self.pos = [-1] * n
+
+    def _up(self, i):
+        """位置 i の要素を上に移動する（穴あけ法）"""
+        v = self.heap[i]
+        k = self.key[v]
+        while i > 0:
+            p = (i - 1) // 2
+            if self.key[self.heap[p]] <= k:
+                break
+            self.heap[i] = self.heap[p]
+            self.pos[self.heap[i]] = i
+            i = p
+        self.heap[i] = v
+        self.pos[v] = i
+
+    def _down(self, i):
+        """位置 i の要素を下に移動する（穴あけ法）"""
+        v = self.heap[i]
+        k = self.key[v]
+        n = len(self.heap)
+        while i * 2 + 1 < n:
+            child1 = i * 2 + 1
+            child2 = i * 2 + 2
+            if child2 < n and self.key[self.heap[child2]] < self.key[self.heap[child1]]:
+                child1 = child2
+            if self.key[self.heap[child1]] >= k:
+                break
+            self.heap[i] = self.heap[child1]
+            self.pos[self.heap[i]] = i
+            i = child1
+        self.heap[i] = v
+        self.pos[v] = i
+
+    def contains(self, v):
+        """要素 v がヒープにあるかどうか"""
+        return self.pos[v] != -1
+
+    def push(self, v, k):
+        """
+        要素 v をキー k で挿入する
+        既にヒープにある場合は、k の方が小さいときだけキーを減らす
+        """
+        if self.pos[v] != -1:
+            self.decrease_key(v, k)
+            return
+        self.key[v] = k
+        self.heap.append(v)
+        self._up(len(self.heap) - 1)
+
+    def decrease_key(self, v, k):
+        """
+        ヒープにある要素 v のキーを k に減らす（k が現在のキー以上なら何もしない）
+
+        Raises:
+            KeyError: v がヒープにない場合 (pop 済み、または push されていない)
+
+        Examples:
+            >>> h = IndexedMinHeap(3)
+            >>> h.push(0, 5)
+            >>> h.push(1, 7)
+            >>> h.pop()
+            (0, 5)
+            >>> h.decrease_key(0, 1)
+            Traceback (most recent call last):
+                ...
+            KeyError: 'Element 0 is not in the heap'
+            >>> h.decrease_key(1, 2)
+            >>> h.top()
+            (1, 2)
+        """
+        if self.pos[v] == -1:
+            raise KeyError(f"Element {v} is not in the heap")
+        if k >= self.key[v]:
+            return
+        self.key[v] = k
+        self._up(self.pos[v])
+
+    def top(self):
+        """キー最小の (要素, キー) を知る"""
+        if not self.heap:
+            return None
+        v = self.heap[0]
+        return v, self.key[v]
+
+    def pop(self):
+        """キー最小の要素を削除して (要素, キー) を返す"""
+        if not self.heap:
+            return None
+
+        v = self.heap[0]
+        x = self.heap.pop()
+        self.pos[v] = -1
+        if self.heap:
+            # 最後尾の要素を根に持ってきて降ろす
+            self.heap[0] = x
+            self._down(0)
+        return v, self.key[v]
+
+    def is_empty(self):
+        return len(self.heap) == 0
+
+    def __len__(self):
+        return len(self.heap)
+
+
 def main():
     """使用例"""
     print("=== 最大ヒープの例 ===")
@@ -158,6 +282,19 @@ def main():
     min_h.pop()
     print(f"min_h.top() = {min_h.top()}")  # 3
 
+    print()
+    print("=== 添字付き最小ヒープの例 ===")
+    idx_h = IndexedMinHeap(4)
+
+    idx_h.push(0, 5)
+    idx_h.push(1, 3)
+    idx_h.push(2, 7)
+    idx_h.decrease_key(2, 1)
+
+    print(f"idx_h.top() = {idx_h.top()}")  # (2, 1)
+    idx_h.pop()
+    print(f"idx_h.top() = {idx_h.top()}")  # (1, 3)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,167 @@
+"""
+巻き戻し可能な Union-Find (Rollback Union-Find) の実装
+
+通常の Union-Find は併合しかできないが、このデータ構造は
+「ある時点の状態に戻す」ことができる。
+分割統治で「この区間の辺を追加して再帰 → 戻ってきたら取り消す」ような
+アルゴリズム (オフライン動的連結性など) で、UnionFind(N) を作り直さずに済む。
+
+主な操作:
+- root(x), isSame(x, y), unite(x, y), size(x): 通常の Union-Find と同じ
+- snapshot(): 現在の状態を表す番号を返す
+- rollback(to): snapshot() で得た番号の状態まで戻す
+- undo(): 直前の併合を 1 回取り消す
+
+通常の Union-Find との違い:
+1. 経路圧縮をしない
+   経路圧縮は root() のたびに多数の親を書き換えるので、全て記録しないと戻せない。
+   union by size だけでも木の高さは O(log N) に抑えられる
+2. 併合のたびに「子にした根とそのサイズ」を履歴 (スタック) に積む
+   取り消しは履歴の末尾を 1 つ取り出して親とサイズを元に戻すだけなので O(1)
+
+データの持ち方は structures.unionFind.UnionFind と同じで、
+par[x] < 0 なら x が根でグループのサイズは -par[x]。
+
+時間計算量: root / isSame / unite は O(log N)、取り消しは 1 回の併合あたり O(1)
+空間計算量: O(N + 併合の回数)
+"""
+
+from array import array
+
+
+class RollbackUnionFind:
+    """
+    巻き戻し可能な Union-Find
+
+    Attributes:
+        par: 親ノードの配列 (par[x] < 0 なら x が根で、-par[x] がグループのサイズ)
+        history: 併合の履歴 (子にした根 y と、そのときの par[y] の組を積む)
+        num_components: 現在のグループの数
+    """
+
+    def __init__(self, n: int) -> None:
+        """
+        巻き戻し可能な Union-Find を初期化する
+
+        Args:
+            n: 要素数
+        """
+        self.par = array("i", [-1]) * n
+        self.history: list[tuple[int, int]] = []
+        self.num_components = n
+
+    def root(self, x: int) -> int:
+        """
+        x の根を求める (経路圧縮なし)
+
+        Args:
+            x: 要素
+
+        Returns:
+            x の属するグループの根
+        """
+        par = self.par
+        while par[x] >= 0:
+            x = par[x]
+        return x
+
+    def isSame(self, x: int, y: int) -> bool:
+        """x と y が同じグループに属するかどうか判定"""
+        return self.root(x) == self.root(y)
+
+    def unite(self, x: int, y: int) -> bool:
+        """
+        x を含むグループと y を含むグループを併合する (union by size)
+
+        併合が行われた場合だけ履歴に積む。
+
+        Args:
+            x: 要素1
+            y: 要素2
+
+        Returns:
+            併合が行われた場合 True、既に同じグループの場合 False
+        """
+        x = self.root(x)
+        y = self.root(y)
+        if x == y:
+            return False
+
+        # y 側のサイズが小さくなるようにする (par は -サイズ)
+        if self.par[x] > self.par[y]:
+            x, y = y, x
+
+        self.history.append((y, self.par[y]))
+        self.par[x] += self.par[y]
+        self.par[y] = x
+        self.num_components -= 1
+        return True
+
+    def size(self, x: int) -> int:
+        """x を含むグループのサイズ"""
+        return -self.par[self.root(x)]
+
+    def snapshot(self) -> int:
+        """
+        現在の状態を表す番号 (これまでに行われた併合の回数) を返す
+
+        Returns:
+            rollback() に渡す番号
+        """
+        return len(self.history)
+
+    def undo(self) -> None:
+        """
+        直前の併合を 1 回取り消す
+
+        Raises:
+            IndexError: 取り消す併合がない場合
+        """
+        if not self.history:
+            raise IndexError("No union to undo")
+
+        # y は x の子にされた根、size_y はそのときの -サイズ
+        y, size_y = self.history.pop()
+        x = self.par[y]
+        self.par[x] -= size_y
+        self.par[y] = size_y
+        self.num_components += 1
+
+    def rollback(self, to: int = 0) -> None:
+        """
+        snapshot() が to を返した時点の状態まで戻す
+
+        Args:
+            to: snapshot() の戻り値 (省略時は初期状態まで戻す)
+
+        Raises:
+            ValueError: to が現在の状態より新しい場合
+        """
+        if to > len(self.history):
+            raise ValueError(f"Cannot roll forward: snapshot {to} > current {len(self.history)}")
+        while len(self.history) > to:
+            self.undo()
+
+
+def main() -> None:
+    """使用例"""
+    print("=== 巻き戻し可能な Union-Find ===\n")
+
+    uf = RollbackUnionFind(6)
+    uf.unite(0, 1)
+    uf.unite(2, 3)
+    print(f"グループ数: {uf.num_components}")  # 4
+
+    s = uf.snapshot()
+    uf.unite(1, 2)
+    uf.unite(4, 5)
+    print(f"併合後: isSame(0, 3) = {uf.isSame(0, 3)}, size(0) = {uf.size(0)}")  # True, 4
+    print(f"グループ数: {uf.num_components}")  # 2
+
+    uf.rollback(s)
+    print(f"巻き戻し後: isSame(0, 3) = {uf.isSame(0, 3)}, size(0) = {uf.size(0)}")  # False, 2
+    print(f"グループ数: {uf.num_components}")  # 4
+
+
+if __name__ == "__main__":
+    main()